@@ -120,6 +120,8 @@ class AIServicer:
 
             # Stream response from coordinator (handles mode switching internally)
             for chunk_text in coordinator.process_message(user_message):
+                if not chunk_text:
+                    continue
                 chunk = ChatChunk(text=chunk_text, done=False)
                 yield chunk
 
@@ -133,16 +135,13 @@ class AIServicer:
             import traceback
             traceback.print_exc()
 
-            # Send error message to client
+            # Send error message to client as the final chunk
             error_chunk = ChatChunk(
                 text=f"I apologize, but I encountered an error: {str(e)}",
-                done=False
+                done=True
             )
             yield error_chunk
 
-            final_chunk = ChatChunk(text="", done=True)
-            yield final_chunk
-
 
 def serve(port=None):
     """
@@ -156,7 +155,13 @@ def serve(port=None):
 
     max_workers = config.server_max_workers
 
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    # Gzip responses for clients that accept it (off by default; costs CPU on loopback)
+    compression = grpc.Compression.Gzip if config.server_compression else None
+
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=max_workers),
+        compression=compression
+    )
 
     # Register the service
     try:
@@ -195,6 +200,7 @@ def serve(port=None):
     print(f"Model: {config.llm_model}")
     print(f"Port: {port}")
     print(f"Max Workers: {max_workers}")
+    print(f"Compression: {'gzip' if compression else 'none'}")
     print("=" * 60)
     print("Server is running...")
     print("Press Ctrl+C to stop")
@@ -6,23 +6,30 @@ It allows easy customization of the AI assistant's identity, appearance, and beh
 """
 
 import os
+import pickle
+import tempfile
+import threading
 import yaml
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+# Prefer the libyaml C parser when available
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Bump when the snapshot layout (or interpolation rules) change
+_SNAPSHOT_VERSION = 1
+
 
 class BrandingConfig:
     """Loads and manages branding configuration."""
 
-    _instance: Optional['BrandingConfig'] = None
-    _config: Dict[str, Any] = {}
-
-    def __new__(cls):
-        """Singleton pattern to ensure single config instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._load_config()
-        return cls._instance
+    def __init__(self):
+        """Load branding configuration (use get_branding_config() for the shared instance)."""
+        self._lock = threading.Lock()
+        self._config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
+        self._replacements: Dict[str, str] = {}
+        self._load_config()
 
     def _load_config(self) -> None:
         """Load branding configuration from branding.yaml."""
@@ -34,17 +41,118 @@ class BrandingConfig:
         if not branding_file.exists():
             print(f"Warning: branding.yaml not found at {branding_file}")
             print("Using default configuration")
-            self._config = self._get_default_config()
+            self._build_lookup(self._get_default_config())
+            return
+
+        # Reuse the parsed snapshot if branding.yaml hasn't changed
+        snapshot_file = self._snapshot_path(branding_file)
+        snapshot = self._read_snapshot(snapshot_file)
+        if snapshot is not None:
+            self._set_lookup(snapshot['config'], snapshot['flat'])
+            print(f"Loaded branding configuration from {snapshot_file}")
             return
 
         try:
             with open(branding_file, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YAML_LOADER)
             print(f"Loaded branding configuration from {branding_file}")
         except Exception as e:
             print(f"Error loading branding.yaml: {e}")
             print("Using default configuration")
-            self._config = self._get_default_config()
+            self._build_lookup(self._get_default_config())
+            return
+
+        self._build_lookup(config)
+        self._write_snapshot(snapshot_file)
+
+    @staticmethod
+    def _snapshot_path(branding_file: Path) -> Path:
+        """Snapshot file name, keyed by branding.yaml's mtime and size."""
+        stat = branding_file.stat()
+        return branding_file.with_name(
+            f"{branding_file.name}.{stat.st_mtime_ns}-{stat.st_size}.pkl"
+        )
+
+    @staticmethod
+    def _read_snapshot(snapshot_file: Path) -> Optional[Dict[str, Any]]:
+        """Read a parsed-config snapshot, or None if missing/unusable."""
+        if not snapshot_file.exists():
+            return None
+
+        try:
+            with open(snapshot_file, 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            print(f"Ignoring branding snapshot {snapshot_file}: {e}")
+            return None
+
+        if not isinstance(snapshot, dict) or snapshot.get('version') != _SNAPSHOT_VERSION:
+            return None
+
+        return snapshot
+
+    def _write_snapshot(self, snapshot_file: Path) -> None:
+        """Atomically write the parsed config snapshot and drop stale ones."""
+        snapshot = {
+            'version': _SNAPSHOT_VERSION,
+            'config': self._config,
+            'flat': self._flat
+        }
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=snapshot_file.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, snapshot_file)
+        except Exception as e:
+            print(f"Could not write branding snapshot: {e}")
+            return
+
+        for stale in snapshot_file.parent.glob("branding.yaml.*.pkl"):
+            if stale != snapshot_file:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+
+    def _build_lookup(self, config: Dict[str, Any]) -> None:
+        """
+        Flatten the configuration into a dot-notation lookup table.
+
+        String values are interpolated once here so get() is a single
+        dict lookup. The table is built aside and swapped in, so readers
+        never see a half-built table during reload().
+        """
+        assistant = config.get('assistant', {}) if isinstance(config, dict) else {}
+        self._replacements = {
+            '{assistant_name}': assistant.get('name', 'Assistant'),
+            '{role}': assistant.get('role', 'AI assistant'),
+            '{credentials}': assistant.get('credentials', 'AI assistant'),
+            '{tagline}': assistant.get('tagline', 'Your AI Companion')
+        }
+
+        flat: Dict[str, Any] = {}
+        self._flatten(flat, '', config)
+
+        self._set_lookup(config, flat)
+
+    def _set_lookup(self, config: Dict[str, Any], flat: Dict[str, Any]) -> None:
+        """Swap in a loaded configuration and its lookup table."""
+        self._config = config
+        self._flat = flat
+
+    def _flatten(self, flat: Dict[str, Any], prefix: str, node: Any) -> None:
+        """Recursively add a config node and its children to the lookup table."""
+        if not isinstance(node, dict):
+            return
+
+        for k, value in node.items():
+            key = f"{prefix}{k}"
+            if isinstance(value, str):
+                flat[key] = self._interpolate(value)
+            else:
+                flat[key] = value
+                self._flatten(flat, f"{key}.", value)
 
     def _get_default_config(self) -> Dict[str, Any]:
         """Return default configuration if branding.yaml is not found."""
@@ -96,15 +204,8 @@ class BrandingConfig:
         if not isinstance(text, str):
             return text
 
-        replacements = {
-            '{assistant_name}': self.get('assistant.name', 'Assistant'),
-            '{role}': self.get('assistant.role', 'AI assistant'),
-            '{credentials}': self.get('assistant.credentials', 'AI assistant'),
-            '{tagline}': self.get('assistant.tagline', 'Your AI Companion')
-        }
-
         result = text
-        for placeholder, value in replacements.items():
+        for placeholder, value in self._replacements.items():
             result = result.replace(placeholder, value)
 
         return result
@@ -120,20 +221,7 @@ class BrandingConfig:
         Returns:
             Configuration value with placeholders replaced
         """
-        keys = key.split('.')
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        # Interpolate placeholders if value is a string
-        if isinstance(value, str):
-            return self._interpolate(value)
-
-        return value
+        return self._flat.get(key, default)
 
     def get_assistant_name(self) -> str:
         """Get the assistant name."""
@@ -173,18 +261,22 @@ class BrandingConfig:
 
     def reload(self) -> None:
         """Reload configuration from file."""
-        self._load_config()
+        with self._lock:
+            self._load_config()
 
 
 # Global instance
-_branding_config = None
+_branding_config: Optional[BrandingConfig] = None
+_branding_config_lock = threading.Lock()
 
 
 def get_branding_config() -> BrandingConfig:
-    """Get the global branding configuration instance."""
+    """Get the global branding configuration instance (loaded once, thread-safe)."""
     global _branding_config
     if _branding_config is None:
-        _branding_config = BrandingConfig()
+        with _branding_config_lock:
+            if _branding_config is None:
+                _branding_config = BrandingConfig()
     return _branding_config
 
 
@@ -123,6 +123,11 @@ class Config:
         """Get the server max workers."""
         return self._config['server'].get('max_workers', 10)
 
+    @property
+    def server_compression(self) -> bool:
+        """Whether to gzip-compress streamed responses."""
+        return self._config['server'].get('compression', 'none') == 'gzip'
+
     @property
     def logging_level(self) -> str:
         """Get the logging level."""
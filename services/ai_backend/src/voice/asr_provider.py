@@ -66,13 +66,14 @@ class WhisperASRProvider(ASRProvider):
     Cost: $0.006 per minute of audio
     """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "whisper-1"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "whisper-1", client=None):
         """
         Initialize Whisper ASR provider.
 
         Args:
             api_key: OpenAI API key (or from OPENAI_API_KEY env var)
             model: Whisper model to use (default: whisper-1)
+            client: Existing OpenAI client to share (keeps connections warm)
         """
         try:
             from openai import OpenAI
@@ -85,9 +86,13 @@ class WhisperASRProvider(ASRProvider):
         if not self.api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY or pass api_key parameter.")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = client or OpenAI(api_key=self.api_key)
         self.model = model
 
+    def close(self):
+        """Close the underlying HTTP connections."""
+        self.client.close()
+
     def transcribe(
         self,
         audio_data: bytes,
@@ -4,7 +4,7 @@ True bidirectional streaming with minimal latency
 """
 import asyncio
 import logging
-from typing import AsyncIterator, Optional, List
+from typing import AsyncIterator, Optional, List, Tuple, Union
 import base64
 import tempfile
 import os
@@ -13,7 +13,6 @@ import grpc
 from collections import deque
 
 from src.voice.voice_service import VoiceService
-from src.config import config
 
 # Import AI backend descriptors for gRPC communication
 import sys
@@ -26,6 +25,43 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Binary audio WebSocket frames: [codec id (1 byte)][flags (1 byte)][audio bytes]
+AUDIO_CODECS = {'mp3': 0x01, 'opus': 0x02, 'wav': 0x03, 'webm': 0x04, 'ogg': 0x05, 'aac': 0x06, 'flac': 0x07}
+AUDIO_CODEC_NAMES = {codec_id: name for name, codec_id in AUDIO_CODECS.items()}
+AUDIO_FRAME_FINAL = 0x01
+
+
+def encode_audio_frame(audio: bytes, format: str, is_final: bool) -> bytes:
+    """
+    Build a binary audio frame.
+
+    Args:
+        audio: Raw audio bytes
+        format: Audio format (mp3, opus, wav, ...)
+        is_final: Whether this is the final audio chunk
+
+    Returns:
+        Frame bytes (2-byte header + audio)
+    """
+    flags = AUDIO_FRAME_FINAL if is_final else 0
+    return bytes((AUDIO_CODECS[format], flags)) + audio
+
+
+def decode_audio_frame(frame: bytes) -> Tuple[str, bool, bytes]:
+    """
+    Parse a binary audio frame.
+
+    Args:
+        frame: Frame bytes as received from the WebSocket
+
+    Returns:
+        (format, is_final, audio bytes)
+    """
+    if len(frame) < 2 or frame[0] not in AUDIO_CODEC_NAMES:
+        raise ValueError("Invalid audio frame")
+
+    return AUDIO_CODEC_NAMES[frame[0]], bool(frame[1] & AUDIO_FRAME_FINAL), frame[2:]
+
 
 class RealtimeVoiceSession:
     """
@@ -39,6 +75,9 @@ class RealtimeVoiceSession:
     - Low latency (~500ms-2s)
     """
 
+    # Max output messages buffered ahead of the WebSocket (backpressure on TTS)
+    OUTPUT_QUEUE_SIZE = 8
+
     def __init__(
         self,
         session_id: str,
@@ -60,6 +99,8 @@ class RealtimeVoiceSession:
         self.is_processing = False
         self.current_user_transcript = ""
         self.current_assistant_transcript = ""
+        # Task processing the current utterance (cancelled on interrupt)
+        self._utterance_task = None
 
         # Audio buffers (chunked)
         self.audio_chunks = deque(maxlen=100)  # Last 100 chunks
@@ -69,11 +110,14 @@ class RealtimeVoiceSession:
         self.text_buffer = ""
         self.last_tts_position = 0
 
-        # Queues
-        self.output_queue = asyncio.Queue()
+        # Queues (bounded so TTS runs at most a few frames ahead of the socket)
+        self.output_queue = asyncio.Queue(maxsize=self.OUTPUT_QUEUE_SIZE)
 
         # TTS settings
         self.tts_speed = 1.0
+        self._audio_format = voice_service.audio_format
+        self.tts_batch_max_sentences = 3  # Max sentences merged into one TTS call
+        self.tts_batch_window = 0.05  # Seconds to wait for more sentences
 
         # gRPC connection
         self.grpc_channel = None
@@ -91,39 +135,63 @@ class RealtimeVoiceSession:
             logger.error(f"Failed to connect to AI backend: {e}")
             raise
 
-    async def process_audio_chunk(self, audio_data: str, format: str, is_final: bool):
+    async def process_audio_chunk(self, audio_data: Union[str, bytes], format: str, is_final: bool):
         """
         Process incoming audio chunk in real-time.
 
         Args:
-            audio_data: Base64 encoded audio chunk
+            audio_data: Raw audio bytes (binary frame) or base64 encoded audio chunk
             format: Audio format (webm, wav, etc.)
             is_final: Whether this is the final chunk (user stopped speaking)
         """
         try:
-            # Decode audio
-            audio_bytes = base64.b64decode(audio_data)
+            # Decode audio (binary frames are already raw bytes)
+            if isinstance(audio_data, str):
+                audio_bytes = base64.b64decode(audio_data)
+            else:
+                audio_bytes = audio_data
 
             # Add to buffer
             self.audio_chunks.append(audio_bytes)
 
             if is_final:
                 # User stopped speaking, process accumulated audio
-                await self.process_complete_utterance()
+                self.start_utterance()
 
         except Exception as e:
             logger.error(f"Error processing audio chunk: {e}")
             await self.send_error(f"Failed to process audio: {str(e)}")
 
-    async def process_complete_utterance(self):
+    def start_utterance(self):
         """
-        Process complete user utterance and stream AI response.
+        Process the buffered utterance in a background task.
+
+        Runs outside the WebSocket receive loop so control messages such as
+        'interrupt' are still read while the reply is being produced.
         """
         if self.is_processing:
             logger.warning("Already processing, ignoring new utterance")
             return
 
         self.is_processing = True
+        self._utterance_task = asyncio.create_task(self.process_complete_utterance())
+
+    async def cancel_utterance(self):
+        """Cancel the in-flight utterance (gRPC stream and TTS) and wait for it to stop."""
+        task = self._utterance_task
+        self._utterance_task = None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def process_complete_utterance(self):
+        """
+        Process complete user utterance and stream AI response.
+        Started through start_utterance(), which sets is_processing.
+        """
         temp_webm = None
         temp_wav = None
 
@@ -209,6 +277,9 @@ class RealtimeVoiceSession:
 
         This is where we connect to the REAL AI backend!
         """
+        tts_task = None
+        response_stream = None
+
         try:
             await self.send_status('thinking')
 
@@ -231,6 +302,10 @@ class RealtimeVoiceSession:
             self.last_tts_position = 0
             sentence_buffer = ""
 
+            # TTS runs in a separate worker so token streaming isn't blocked
+            sentence_queue = asyncio.Queue()
+            tts_task = asyncio.create_task(self.tts_worker(sentence_queue))
+
             await self.send_status('speaking')
 
             # Stream response tokens
@@ -243,27 +318,74 @@ class RealtimeVoiceSession:
                     # Send partial transcript
                     await self.send_transcript(self.text_buffer, 'assistant', is_final=False)
 
-                    # Check for sentence boundaries
-                    if self.has_sentence_boundary(sentence_buffer):
-                        # Generate TTS for this sentence
-                        await self.synthesize_and_stream(sentence_buffer.strip())
+                    # Check for sentence boundaries (earlier text was already checked)
+                    if self.has_sentence_boundary(chunk.text):
+                        # Queue this sentence for TTS
+                        await sentence_queue.put(sentence_buffer.strip())
                         sentence_buffer = ""
 
                 if chunk.done:
                     # Final chunk - synthesize any remaining text
                     if sentence_buffer.strip():
-                        await self.synthesize_and_stream(sentence_buffer.strip())
-
-                    # Send final transcript
-                    await self.send_transcript(self.text_buffer, 'assistant', is_final=True)
+                        await sentence_queue.put(sentence_buffer.strip())
                     break
 
+            # Signal end of response and wait for remaining audio
+            await sentence_queue.put(None)
+            await tts_task
+
+            # Send final transcript
+            await self.send_transcript(self.text_buffer, 'assistant', is_final=True)
+
         except grpc.aio.AioRpcError as e:
             logger.error(f"gRPC error: {e.code()} - {e.details()}")
             await self.send_error("AI service unavailable")
         except Exception as e:
             logger.error(f"Error streaming AI response: {e}", exc_info=True)
             await self.send_error(f"AI response failed: {str(e)}")
+        finally:
+            if tts_task and not tts_task.done():
+                tts_task.cancel()
+            if response_stream is not None and not response_stream.done():
+                # Stop generation on the AI backend too (e.g. on interrupt)
+                response_stream.cancel()
+
+    async def tts_worker(self, sentence_queue: asyncio.Queue):
+        """
+        Synthesize queued sentences, batching short ones into a single TTS call.
+
+        The first sentence is synthesized immediately to keep time-to-first-audio
+        low; later sentences that arrive within `tts_batch_window` are merged
+        (up to `tts_batch_max_sentences`) to save API round trips.
+
+        Args:
+            sentence_queue: Queue of sentences, terminated by None
+        """
+        first_sentence = True
+        finished = False
+
+        while not finished:
+            sentence = await sentence_queue.get()
+            if sentence is None:
+                break
+
+            batch = [sentence]
+            if not first_sentence:
+                while len(batch) < self.tts_batch_max_sentences:
+                    try:
+                        sentence = await asyncio.wait_for(
+                            sentence_queue.get(),
+                            timeout=self.tts_batch_window
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                    if sentence is None:
+                        finished = True
+                        break
+                    batch.append(sentence)
+
+            first_sentence = False
+            await self.synthesize_and_stream(' '.join(batch))
 
     def has_sentence_boundary(self, text: str) -> bool:
         """Check if text contains a sentence boundary."""
@@ -280,20 +402,15 @@ class RealtimeVoiceSession:
             if not text or len(text) < 3:
                 return
 
-            # Generate audio
-            audio_data = self.voice_service.synthesize_response(
+            # Generate audio (off the event loop; repeated sentences hit the TTS cache)
+            audio_data = await asyncio.to_thread(
+                self.voice_service.synthesize_sentence,
                 text=text,
                 speed=self.tts_speed
             )
 
-            # Get format
-            audio_format = config.voice.get('audio', {}).get('format', 'mp3')
-
-            # Encode to base64
-            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-
             # Stream audio chunk to client
-            await self.send_audio_chunk(audio_base64, audio_format, is_final=False)
+            await self.send_audio_chunk(audio_data, self._audio_format, is_final=False)
 
         except Exception as e:
             logger.error(f"Error in TTS synthesis: {e}")
@@ -306,10 +423,11 @@ class RealtimeVoiceSession:
                 logger.info(f"TTS speed set to {self.tts_speed}")
 
             elif command == 'interrupt':
-                # Clear buffers and stop processing
+                # Stop the reply in progress, then clear buffers and drop unsent audio
+                await self.cancel_utterance()
                 self.audio_chunks.clear()
                 self.text_buffer = ""
-                self.is_processing = False
+                self.drop_queued_audio()
                 logger.info("Session interrupted")
 
         except Exception as e:
@@ -323,17 +441,11 @@ class RealtimeVoiceSession:
             'role': role,
             'is_final': is_final
         }
-        await self.output_queue.put(message)
+        await self.output_queue.put(('json', message))
 
-    async def send_audio_chunk(self, audio_base64: str, format: str, is_final: bool):
-        """Send audio chunk to client."""
-        message = {
-            'type': 'audio_chunk',
-            'data': audio_base64,
-            'format': format,
-            'is_final': is_final
-        }
-        await self.output_queue.put(message)
+    async def send_audio_chunk(self, audio_data: bytes, format: str, is_final: bool):
+        """Send audio chunk to client as a binary frame."""
+        await self.output_queue.put(('audio', encode_audio_frame(audio_data, format, is_final)))
 
     async def send_status(self, status: str):
         """Send status update to client."""
@@ -341,7 +453,7 @@ class RealtimeVoiceSession:
             'type': 'status',
             'status': status
         }
-        await self.output_queue.put(message)
+        await self.output_queue.put(('json', message))
 
     async def send_error(self, error: str):
         """Send error message to client."""
@@ -349,10 +461,45 @@ class RealtimeVoiceSession:
             'type': 'error',
             'error': error
         }
-        await self.output_queue.put(message)
+        await self.output_queue.put(('json', message))
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of output messages waiting to be sent to the client."""
+        return self.output_queue.qsize()
 
-    async def get_output_messages(self) -> AsyncIterator[dict]:
-        """Yield output messages to client."""
+    def drop_queued_audio(self) -> int:
+        """
+        Discard audio frames that have not been sent yet (e.g. on barge-in).
+
+        Transcript, status and error messages are kept in order.
+
+        Returns:
+            Number of audio frames dropped
+        """
+        kept = []
+        dropped = 0
+        while not self.output_queue.empty():
+            item = self.output_queue.get_nowait()
+            if item[0] == 'audio':
+                dropped += 1
+            else:
+                kept.append(item)
+
+        for item in kept:
+            self.output_queue.put_nowait(item)
+
+        if dropped:
+            logger.info(f"Dropped {dropped} queued audio frames")
+        return dropped
+
+    async def get_output_messages(self) -> AsyncIterator[Tuple[str, Union[dict, bytes]]]:
+        """
+        Yield output messages to client.
+
+        Yields:
+            ('json', message dict) or ('audio', binary audio frame)
+        """
         while self.is_active or not self.output_queue.empty():
             try:
                 message = await asyncio.wait_for(
@@ -375,6 +522,8 @@ class RealtimeVoiceSession:
         """Stop the session."""
         self.is_active = False
         self.audio_chunks.clear()
+        if self._utterance_task and not self._utterance_task.done():
+            self._utterance_task.cancel()
         if self.grpc_channel:
             asyncio.create_task(self.grpc_channel.close())
         logger.info(f"Real-time session {self.session_id} stopped")
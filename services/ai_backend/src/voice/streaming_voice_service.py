@@ -9,10 +9,9 @@ import json
 import base64
 import tempfile
 import os
-import subprocess
+from collections import deque
 
 from src.voice.voice_service import VoiceService
-from src.config import config
 
 logger = logging.getLogger(__name__)
 
@@ -37,18 +36,23 @@ class StreamingVoiceSession:
 
         # State
         self.is_active = False
-        self.current_user_audio = []
+        self.current_user_audio = bytearray()  # Contiguous buffer, avoids one object per chunk
         self.current_user_text = ""
         self.current_assistant_text = ""
 
         # Queues for async communication
         self.audio_input_queue = asyncio.Queue()
-        self.transcript_output_queue = asyncio.Queue()
-        self.audio_output_queue = asyncio.Queue()
         self.control_queue = asyncio.Queue()
 
+        # Outgoing messages: single producer / single consumer, so plain
+        # deques plus one wakeup event are enough (transcripts take priority)
+        self.transcript_outbox = deque()
+        self.audio_outbox = deque()
+        self.outbox_event = asyncio.Event()
+
         # TTS settings
         self.tts_speed = 1.0
+        self._audio_format = voice_service.audio_format
 
         logger.info(f"Created streaming voice session: {session_id}")
 
@@ -65,8 +69,8 @@ class StreamingVoiceSession:
             # Decode base64 audio
             audio_bytes = base64.b64decode(audio_data)
 
-            # Accumulate audio chunks
-            self.current_user_audio.append(audio_bytes)
+            # Accumulate audio in place
+            self.current_user_audio += audio_bytes
 
             if is_final:
                 # User finished speaking, transcribe complete audio
@@ -84,8 +88,8 @@ class StreamingVoiceSession:
         temp_wav = None
 
         try:
-            # Combine all audio chunks
-            complete_audio = b''.join(self.current_user_audio)
+            # Snapshot accumulated audio
+            complete_audio = bytes(self.current_user_audio)
 
             # Send status update
             await self.send_status('transcribing')
@@ -97,57 +101,13 @@ class StreamingVoiceSession:
 
             logger.info(f"Saved {len(complete_audio)} bytes to {temp_webm}")
 
-            # Try to convert webm to wav using ffmpeg (if available)
             temp_wav = temp_webm.replace('.webm', '.wav')
-            transcript = None
-
-            try:
-                ffmpeg_cmd = [
-                    'ffmpeg',
-                    '-i', temp_webm,
-                    '-ar', '16000',  # 16kHz sample rate
-                    '-ac', '1',       # Mono
-                    '-y',             # Overwrite
-                    temp_wav
-                ]
-
-                result = subprocess.run(
-                    ffmpeg_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-
-                if result.returncode == 0:
-                    logger.info(f"Converted to WAV: {temp_wav}")
-
-                    # Read WAV file
-                    with open(temp_wav, 'rb') as f:
-                        wav_data = f.read()
-
-                    # Transcribe WAV audio using ASR
-                    transcript = self.voice_service.transcribe_audio(
-                        audio_data=wav_data,
-                        audio_format='wav'
-                    )
-                else:
-                    logger.warning(f"FFmpeg conversion failed: {result.stderr}")
-                    transcript = None
-
-            except FileNotFoundError:
-                logger.warning("FFmpeg not found - install FFmpeg for better audio compatibility")
-                transcript = None
-            except Exception as e:
-                logger.warning(f"FFmpeg error: {e}")
-                transcript = None
-
-            # Fallback to direct WebM transcription if FFmpeg failed or not available
-            if transcript is None:
-                logger.info("Trying direct WebM transcription")
-                transcript = self.voice_service.transcribe_audio(
-                    audio_data=complete_audio,
-                    audio_format='webm'
-                )
+            if self.voice_service.asr_race_formats:
+                # Race ffmpeg→WAV transcription against direct WebM transcription
+                # and take the first non-empty transcript
+                transcript = await self.transcribe_first_success(complete_audio, temp_webm, temp_wav)
+            else:
+                transcript = await self.transcribe_with_fallback(complete_audio, temp_webm, temp_wav)
 
             if not transcript or not transcript.strip():
                 logger.warning("Empty transcription result")
@@ -183,6 +143,144 @@ class StreamingVoiceSession:
                     except Exception as e:
                         logger.warning(f"Failed to delete temp file {temp_file}: {e}")
 
+    async def transcribe_with_fallback(
+        self,
+        complete_audio: bytes,
+        temp_webm: str,
+        temp_wav: str
+    ) -> Optional[str]:
+        """
+        Transcribe via ffmpeg→WAV, falling back to direct WebM transcription.
+        Only one ASR request is made unless the WAV path fails.
+
+        Args:
+            complete_audio: Raw WebM audio
+            temp_webm: Path of the saved WebM file
+            temp_wav: Path to write the converted WAV file to
+
+        Returns:
+            Transcript
+        """
+        try:
+            transcript = await self.transcribe_via_ffmpeg(temp_webm, temp_wav)
+        except Exception as e:
+            logger.warning(f"FFmpeg error: {e}")
+            transcript = None
+
+        # Fallback to direct WebM transcription if FFmpeg failed or not available
+        if transcript is None:
+            logger.info("Trying direct WebM transcription")
+            transcript = await self.voice_service.transcribe_audio_async(
+                complete_audio, audio_format='webm'
+            )
+
+        return transcript
+
+    async def transcribe_first_success(
+        self,
+        complete_audio: bytes,
+        temp_webm: str,
+        temp_wav: str
+    ) -> Optional[str]:
+        """
+        Run both ASR paths concurrently and return the first non-empty transcript.
+
+        Enabled by the asr.race_formats voice setting. Bills two ASR calls per
+        utterance: the losing task is cancelled (which stops ffmpeg and any ASR
+        call not yet started), but a request already sent from its worker
+        thread still runs to completion.
+
+        Args:
+            complete_audio: Raw WebM audio
+            temp_webm: Path of the saved WebM file
+            temp_wav: Path to write the converted WAV file to
+
+        Returns:
+            Transcript, or None if neither path produced text
+        """
+        pending = {
+            asyncio.create_task(self.transcribe_via_ffmpeg(temp_webm, temp_wav)),
+            asyncio.create_task(
+                self.voice_service.transcribe_audio_async(complete_audio, audio_format='webm')
+            ),
+        }
+        transcript = None
+        error = None
+
+        try:
+            while pending and not transcript:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.warning(f"ASR path failed: {e}")
+                        error = e
+                        continue
+                    if result and result.strip():
+                        transcript = result
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if transcript is None and error is not None:
+            raise error
+
+        return transcript
+
+    async def transcribe_via_ffmpeg(self, temp_webm: str, temp_wav: str) -> Optional[str]:
+        """
+        Convert WebM to 16kHz mono WAV with ffmpeg and transcribe it.
+
+        Args:
+            temp_webm: Path of the saved WebM file
+            temp_wav: Path to write the converted WAV file to
+
+        Returns:
+            Transcript, or None if ffmpeg is unavailable or conversion failed
+        """
+        ffmpeg_cmd = [
+            'ffmpeg',
+            '-i', temp_webm,
+            '-ar', '16000',  # 16kHz sample rate
+            '-ac', '1',       # Mono
+            '-y',             # Overwrite
+            temp_wav
+        ]
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *ffmpeg_cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                _, stderr = await asyncio.wait_for(process.communicate(), timeout=10)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                process.kill()
+                await process.wait()
+                raise
+        except FileNotFoundError:
+            logger.warning("FFmpeg not found - install FFmpeg for better audio compatibility")
+            return None
+        except asyncio.TimeoutError:
+            logger.warning("FFmpeg conversion timed out")
+            return None
+
+        if process.returncode != 0:
+            logger.warning(f"FFmpeg conversion failed: {stderr.decode(errors='replace')}")
+            return None
+
+        logger.info(f"Converted to WAV: {temp_wav}")
+
+        # Read WAV file
+        with open(temp_wav, 'rb') as f:
+            wav_data = f.read()
+
+        # Transcribe WAV audio using ASR
+        return await self.voice_service.transcribe_audio_async(wav_data, audio_format='wav')
+
     async def get_ai_response(self, user_message: str):
         """
         Get AI response for user message and convert to speech.
@@ -253,20 +351,8 @@ class StreamingVoiceSession:
                 speed=self.tts_speed
             )
 
-            # Get audio format from config
-            audio_format = config.voice.get('audio', {}).get('format', 'mp3')
-
-            # Encode to base64
-            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-
-            # Send audio chunk to client
-            await self.send_audio_chunk(audio_base64, audio_format, is_final=True)
-
-            # Update status
-            await self.send_status('speaking')
-
-            # Send final transcript
-            await self.send_transcript(text, 'assistant', is_final=True)
+            # Send audio, 'speaking' status and final transcript as one frame
+            await self.send_combined(audio_data, text, 'speaking')
 
         except Exception as e:
             logger.error(f"Error in TTS synthesis: {e}")
@@ -288,7 +374,8 @@ class StreamingVoiceSession:
             'is_final': is_final
         }
 
-        await self.transcript_output_queue.put(message)
+        self.transcript_outbox.append(message)
+        self.outbox_event.set()
 
     async def send_audio_chunk(self, audio_base64: str, format: str, is_final: bool):
         """
@@ -306,7 +393,31 @@ class StreamingVoiceSession:
             'is_final': is_final
         }
 
-        await self.audio_output_queue.put(message)
+        self.audio_outbox.append(message)
+        self.outbox_event.set()
+
+    async def send_combined(self, audio_bytes: bytes, text: str, status: str):
+        """
+        Send the final audio, status and assistant transcript of a turn
+        to client as a single message.
+
+        Args:
+            audio_bytes: Synthesized audio data
+            text: Final assistant transcript
+            status: Status to report alongside the audio
+        """
+        message = {
+            'type': 'turn_final',
+            'audio_b64': base64.b64encode(audio_bytes).decode('utf-8'),
+            'format': self._audio_format,
+            'text': text,
+            'role': 'assistant',
+            'status': status,
+            'is_final': True
+        }
+
+        self.audio_outbox.append(message)
+        self.outbox_event.set()
 
     async def send_status(self, status: str):
         """
@@ -320,7 +431,8 @@ class StreamingVoiceSession:
             'status': status
         }
 
-        await self.transcript_output_queue.put(message)
+        self.transcript_outbox.append(message)
+        self.outbox_event.set()
 
     async def send_error(self, error: str):
         """
@@ -334,7 +446,8 @@ class StreamingVoiceSession:
             'error': error
         }
 
-        await self.transcript_output_queue.put(message)
+        self.transcript_outbox.append(message)
+        self.outbox_event.set()
 
     async def handle_control(self, command: str, params: dict):
         """
@@ -362,32 +475,29 @@ class StreamingVoiceSession:
 
     def reset_audio_buffer(self):
         """Reset accumulated audio buffer."""
-        self.current_user_audio = []
+        self.current_user_audio = bytearray()
 
     async def get_output_messages(self) -> AsyncIterator[dict]:
         """
         Yield output messages (transcripts, audio, status) to client.
         """
-        while self.is_active or not self.transcript_output_queue.empty() or not self.audio_output_queue.empty():
+        while self.is_active or self.transcript_outbox or self.audio_outbox:
             try:
-                # Try to get message from transcript queue (prioritize transcripts)
-                try:
-                    message = self.transcript_output_queue.get_nowait()
-                    yield message
+                # Prioritize transcripts over audio
+                if self.transcript_outbox:
+                    yield self.transcript_outbox.popleft()
                     continue
-                except asyncio.QueueEmpty:
-                    pass
 
-                # Try to get message from audio queue
-                try:
-                    message = self.audio_output_queue.get_nowait()
-                    yield message
+                if self.audio_outbox:
+                    yield self.audio_outbox.popleft()
                     continue
-                except asyncio.QueueEmpty:
-                    pass
 
-                # Wait a bit before checking again
-                await asyncio.sleep(0.1)
+                # Wait for new messages (timeout so a stopped session exits)
+                self.outbox_event.clear()
+                try:
+                    await asyncio.wait_for(self.outbox_event.wait(), timeout=0.1)
+                except asyncio.TimeoutError:
+                    pass
 
             except Exception as e:
                 logger.error(f"Error yielding output message: {e}")
@@ -3,6 +3,7 @@ TTS (Text-to-Speech) Providers
 
 Converts text to speech audio using various APIs.
 """
+import functools
 import os
 from abc import ABC, abstractmethod
 from typing import Optional, Iterator, BinaryIO
@@ -21,7 +22,8 @@ class TTSProvider(ABC):
         self,
         text: str,
         voice: Optional[str] = None,
-        speed: float = 1.0
+        speed: float = 1.0,
+        response_format: str = "mp3"
     ) -> bytes:
         """
         Synthesize text to speech audio (complete).
@@ -30,6 +32,7 @@ class TTSProvider(ABC):
             text: Text to convert to speech
             voice: Voice ID/name to use
             speed: Speech speed (0.25 to 4.0)
+            response_format: Audio format (mp3, opus, wav, ...)
 
         Returns:
             Audio data as bytes
@@ -41,7 +44,8 @@ class TTSProvider(ABC):
         self,
         text: str,
         voice: Optional[str] = None,
-        speed: float = 1.0
+        speed: float = 1.0,
+        response_format: str = "mp3"
     ) -> Iterator[bytes]:
         """
         Synthesize text to speech audio (streaming).
@@ -50,6 +54,7 @@ class TTSProvider(ABC):
             text: Text to convert to speech
             voice: Voice ID/name to use
             speed: Speech speed (0.25 to 4.0)
+            response_format: Audio format (mp3, opus, wav, ...)
 
         Yields:
             Audio chunks as bytes
@@ -82,7 +87,8 @@ class OpenAITTSProvider(TTSProvider):
         self,
         api_key: Optional[str] = None,
         model: str = "tts-1",
-        default_voice: str = "nova"
+        default_voice: str = "nova",
+        client=None
     ):
         """
         Initialize OpenAI TTS provider.
@@ -91,6 +97,7 @@ class OpenAITTSProvider(TTSProvider):
             api_key: OpenAI API key (or from OPENAI_API_KEY env var)
             model: TTS model to use (tts-1 or tts-1-hd)
             default_voice: Default voice to use
+            client: Existing OpenAI client to share (keeps connections warm)
         """
         try:
             from openai import OpenAI
@@ -103,18 +110,48 @@ class OpenAITTSProvider(TTSProvider):
         if not self.api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY or pass api_key parameter.")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = client or OpenAI(api_key=self.api_key)
         self.model = model  # tts-1 (fast) or tts-1-hd (quality)
         self.default_voice = default_voice
 
         if default_voice not in self.VOICES:
             raise ValueError(f"Invalid voice '{default_voice}'. Choose from: {', '.join(self.VOICES)}")
 
+        # Pre-bound request for the common case (default voice)
+        self._create = functools.partial(
+            self.client.audio.speech.create,
+            model=self.model,
+            voice=self.default_voice
+        )
+
+    def close(self):
+        """Close the underlying HTTP connections."""
+        self.client.close()
+
+    def _create_speech(self, text: str, voice: Optional[str], speed: float, response_format: str):
+        """
+        Issue a speech.create request, validating only non-default arguments.
+
+        The default voice is validated once in __init__, so calls that don't
+        override it go straight through the pre-bound partial.
+        """
+        if not (0.25 <= speed <= 4.0):
+            raise ValueError(f"Speed must be between 0.25 and 4.0, got {speed}")
+
+        if voice is None or voice == self.default_voice:
+            return self._create(input=text, speed=speed, response_format=response_format)
+
+        if voice not in self.VOICES:
+            raise ValueError(f"Invalid voice '{voice}'. Choose from: {', '.join(self.VOICES)}")
+
+        return self._create(input=text, speed=speed, response_format=response_format, voice=voice)
+
     def synthesize(
         self,
         text: str,
         voice: Optional[str] = None,
-        speed: float = 1.0
+        speed: float = 1.0,
+        response_format: str = "mp3"
     ) -> bytes:
         """
         Synthesize complete text to speech audio.
@@ -123,26 +160,13 @@ class OpenAITTSProvider(TTSProvider):
             text: Text to convert to speech
             voice: Voice name (alloy, echo, fable, onyx, nova, shimmer)
             speed: Speech speed (0.25 to 4.0, default 1.0)
+            response_format: Audio format (mp3, opus, aac, flac, wav, pcm)
 
         Returns:
-            Complete audio data as bytes (MP3 format)
+            Complete audio data as bytes (in response_format)
         """
-        voice = voice or self.default_voice
-
-        if voice not in self.VOICES:
-            raise ValueError(f"Invalid voice '{voice}'. Choose from: {', '.join(self.VOICES)}")
-
-        if not (0.25 <= speed <= 4.0):
-            raise ValueError(f"Speed must be between 0.25 and 4.0, got {speed}")
-
         try:
-            response = self.client.audio.speech.create(
-                model=self.model,
-                voice=voice,
-                input=text,
-                speed=speed,
-                response_format="mp3"
-            )
+            response = self._create_speech(text, voice, speed, response_format)
 
             # Read all audio data
             return response.content
@@ -155,7 +179,8 @@ class OpenAITTSProvider(TTSProvider):
         self,
         text: str,
         voice: Optional[str] = None,
-        speed: float = 1.0
+        speed: float = 1.0,
+        response_format: str = "mp3"
     ) -> Iterator[bytes]:
         """
         Synthesize text to speech audio with streaming.
@@ -167,27 +192,14 @@ class OpenAITTSProvider(TTSProvider):
             text: Text to convert to speech
             voice: Voice name (alloy, echo, fable, onyx, nova, shimmer)
             speed: Speech speed (0.25 to 4.0, default 1.0)
+            response_format: Audio format (mp3, opus, aac, flac, wav, pcm)
 
         Yields:
-            Audio chunks as bytes (MP3 format)
+            Audio chunks as bytes (in response_format)
         """
-        voice = voice or self.default_voice
-
-        if voice not in self.VOICES:
-            raise ValueError(f"Invalid voice '{voice}'. Choose from: {', '.join(self.VOICES)}")
-
-        if not (0.25 <= speed <= 4.0):
-            raise ValueError(f"Speed must be between 0.25 and 4.0, got {speed}")
-
         try:
             # Create streaming response
-            response = self.client.audio.speech.create(
-                model=self.model,
-                voice=voice,
-                input=text,
-                speed=speed,
-                response_format="mp3"
-            )
+            response = self._create_speech(text, voice, speed, response_format)
 
             # Stream audio chunks
             # OpenAI returns the response object which can be iterated
@@ -296,7 +308,8 @@ class GoogleTTSProvider(TTSProvider):
         self,
         text: str,
         voice: Optional[str] = None,
-        speed: float = 1.0
+        speed: float = 1.0,
+        response_format: str = "mp3"
     ) -> bytes:
         """
         Synthesize text to speech using Google TTS.
@@ -305,9 +318,10 @@ class GoogleTTSProvider(TTSProvider):
             text: Text to convert to speech
             voice: Voice name (Journey, Puck, Charon, Kore, Fenrir, Aoede)
             speed: Speech speed (0.25 to 4.0)
+            response_format: Audio format (mp3, opus, wav)
 
         Returns:
-            Audio data as bytes (MP3 format)
+            Audio data as bytes (in response_format)
         """
         voice = voice or self.default_voice
 
@@ -334,8 +348,19 @@ class GoogleTTSProvider(TTSProvider):
             )
 
             # Audio configuration
+            encodings = {
+                'mp3': texttospeech.AudioEncoding.MP3,
+                'opus': texttospeech.AudioEncoding.OGG_OPUS,
+                'wav': texttospeech.AudioEncoding.LINEAR16
+            }
+            if response_format not in encodings:
+                raise ValueError(
+                    f"Unsupported audio format '{response_format}'. "
+                    f"Choose from: {', '.join(encodings)}"
+                )
+
             audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
+                audio_encoding=encodings[response_format],
                 speaking_rate=speed
             )
 
@@ -358,7 +383,8 @@ class GoogleTTSProvider(TTSProvider):
         self,
         text: str,
         voice: Optional[str] = None,
-        speed: float = 1.0
+        speed: float = 1.0,
+        response_format: str = "mp3"
     ) -> Iterator[bytes]:
         """
         Synthesize text to speech with streaming (if supported).
@@ -370,13 +396,14 @@ class GoogleTTSProvider(TTSProvider):
             text: Text to convert
             voice: Voice name
             speed: Speech speed
+            response_format: Audio format (mp3, opus, wav)
 
         Yields:
             Audio chunks as bytes
         """
         # Google TTS may not support streaming like OpenAI
         # Return complete audio for now
-        audio_data = self.synthesize(text, voice, speed)
+        audio_data = self.synthesize(text, voice, speed, response_format)
         yield audio_data
 
     def synthesize_to_file(
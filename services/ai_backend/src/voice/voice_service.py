@@ -6,9 +6,70 @@ Provides high-level voice chat functionality:
 - Text → audio output (TTS)
 - Integrated with TherapeuticCoordinator streaming
 """
-from typing import Iterator, Optional
-from .asr_provider import ASRProvider, WhisperASRProvider
-from .tts_provider import TTSProvider, OpenAITTSProvider
+import asyncio
+import functools
+import io
+import json
+import re
+import subprocess
+import threading
+import wave
+from collections import deque
+from typing import AsyncIterator, Dict, Iterator, Optional
+from .asr_provider import ASRProvider, WhisperASRProvider, LocalWhisperProvider, WhisperXProvider
+from .tts_provider import TTSProvider, OpenAITTSProvider, GoogleTTSProvider
+
+
+# Sentence end, optionally followed by a closing quote/bracket and whitespace
+_SENTENCE_END = re.compile(r'[.!?]["\')\]]?\s*\Z')
+
+
+class _SentenceBuffer:
+    """
+    Accumulates streamed text and decides when to flush it to TTS.
+
+    Flushes on a newline, or on a sentence end once the buffer reaches the
+    threshold (smaller for the first flush to keep first audio fast).
+    """
+
+    # Only the tail of a chunk needs to be inspected for a sentence end
+    TAIL_CHARS = 8
+
+    def __init__(self, first_threshold: int, threshold: int):
+        self.buffer = ""
+        self.threshold = first_threshold
+        self.next_threshold = threshold
+        self.at_sentence_end = False
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """
+        Add a text chunk.
+
+        Returns:
+            Text to synthesize if the buffer should be flushed, else None
+        """
+        self.buffer += chunk
+
+        # Empty or whitespace-only chunks keep the previous state
+        if chunk and not chunk.isspace():
+            self.at_sentence_end = _SENTENCE_END.search(chunk[-self.TAIL_CHARS:]) is not None
+
+        # Flush on a newline, or on a sentence end once enough text is buffered
+        hard_boundary = '\n' in chunk
+        if hard_boundary or (len(self.buffer) >= self.threshold and self.at_sentence_end):
+            segment = self.flush()
+            if segment:
+                self.threshold = self.next_threshold
+            return segment
+
+        return None
+
+    def flush(self) -> Optional[str]:
+        """Return any buffered text and reset the buffer."""
+        segment = self.buffer if self.buffer.strip() else None
+        self.buffer = ""
+        self.at_sentence_end = False
+        return segment
 
 
 class VoiceService:
@@ -24,11 +85,27 @@ class VoiceService:
     6. Audio played to user
     """
 
+    # Sentences longer than this are not cached (rarely repeat, large audio)
+    TTS_CACHE_MAX_CHARS = 200
+
+    # Buffered text is flushed to TTS once it ends a sentence and reaches this
+    # size; the first flush uses a smaller threshold to keep first audio fast
+    FLUSH_THRESHOLD_CHARS = 180
+    FIRST_FLUSH_THRESHOLD_CHARS = 40
+
+    # Services built by create_from_config, keyed by voice config + API keys
+    _instances: Dict[str, 'VoiceService'] = {}
+    _instances_lock = threading.Lock()
+
     def __init__(
         self,
         asr_provider: ASRProvider,
         tts_provider: TTSProvider,
-        asr_language: str = "en"
+        asr_language: str = "en",
+        tts_cache_size: int = 512,
+        audio_format: str = "mp3",
+        asr_speedup: float = 1.0,
+        asr_race_formats: bool = False
     ):
         """
         Initialize voice service.
@@ -37,15 +114,33 @@ class VoiceService:
             asr_provider: ASR provider instance (e.g., WhisperASRProvider)
             tts_provider: TTS provider instance (e.g., OpenAITTSProvider)
             asr_language: Language code for ASR (default: 'en')
+            tts_cache_size: Max number of synthesized sentences kept in memory
+            audio_format: TTS output format (opus is roughly half the size of mp3)
+            asr_speedup: Tempo applied to audio before ASR (1.0 = off, 0.5 to 2.0)
+            asr_race_formats: Streaming sessions race WAV and WebM transcription
+                (two billed ASR calls per utterance) instead of falling back
         """
+        if not (0.5 <= asr_speedup <= 2.0):
+            raise ValueError(f"ASR speedup must be between 0.5 and 2.0, got {asr_speedup}")
+
         self.asr = asr_provider
         self.tts = tts_provider
         self.asr_language = asr_language
+        self.audio_format = audio_format
+        self.asr_speedup = asr_speedup
+        self.asr_race_formats = asr_race_formats
+
+        # Bound once so the per-sentence path skips the self.tts attribute chain
+        self._synth_stream = functools.partial(tts_provider.synthesize_stream, response_format=audio_format)
+
+        # Per-instance LRU cache of synthesized sentences
+        self._synth_cached = functools.lru_cache(maxsize=tts_cache_size)(self._synth)
 
     def transcribe_audio(
         self,
         audio_data: bytes,
-        audio_format: str = "wav"
+        audio_format: str = "wav",
+        speedup: Optional[float] = None
     ) -> str:
         """
         Transcribe audio to text.
@@ -53,16 +148,77 @@ class VoiceService:
         Args:
             audio_data: Raw audio bytes
             audio_format: Audio format (wav, mp3, webm)
+            speedup: Tempo override for this call (default: self.asr_speedup)
 
         Returns:
             Transcribed text
         """
+        speedup = self.asr_speedup if speedup is None else speedup
+        if speedup != 1.0:
+            audio_data, audio_format = self._speed_up_audio(audio_data, audio_format, speedup)
+
         return self.asr.transcribe(
             audio_data=audio_data,
             language=self.asr_language,
             audio_format=audio_format
         )
 
+    async def transcribe_audio_async(
+        self,
+        audio_data: bytes,
+        audio_format: str = "wav",
+        speedup: Optional[float] = None
+    ) -> str:
+        """
+        Transcribe audio to text without blocking the event loop.
+
+        Args:
+            audio_data: Raw audio bytes
+            audio_format: Audio format (wav, mp3, webm)
+            speedup: Tempo override for this call (default: self.asr_speedup)
+
+        Returns:
+            Transcribed text
+        """
+        return await asyncio.to_thread(self.transcribe_audio, audio_data, audio_format, speedup)
+
+    @staticmethod
+    def _speed_up_audio(audio_data: bytes, audio_format: str, speedup: float):
+        """
+        Time-stretch audio (pitch preserved) with ffmpeg's atempo filter.
+
+        Shorter audio means fewer billed ASR seconds and a faster transcription.
+        Falls back to the original audio if ffmpeg is missing or fails.
+
+        Args:
+            audio_data: Raw audio bytes
+            audio_format: Audio format (wav, mp3, webm)
+            speedup: Tempo factor (0.5 to 2.0)
+
+        Returns:
+            Tuple of (audio bytes, audio format)
+        """
+        ffmpeg_cmd = [
+            'ffmpeg', '-loglevel', 'error',
+            '-i', 'pipe:0',
+            '-filter:a', f'atempo={speedup}',
+            '-ar', '16000', '-ac', '1',
+            '-f', 'wav', 'pipe:1'
+        ]
+
+        try:
+            result = subprocess.run(
+                ffmpeg_cmd,
+                input=audio_data,
+                capture_output=True,
+                timeout=10,
+                check=True
+            )
+            return result.stdout, "wav"
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"ASR speedup skipped (ffmpeg failed): {e}")
+            return audio_data, audio_format
+
     def synthesize_response(
         self,
         text: str,
@@ -78,14 +234,47 @@ class VoiceService:
             speed: Speech speed
 
         Returns:
-            Audio data as bytes
+            Audio data as bytes (in self.audio_format)
         """
         return self.tts.synthesize(
             text=text,
             voice=voice,
-            speed=speed
+            speed=speed,
+            response_format=self.audio_format
         )
 
+    def _synth(self, text: str, voice: Optional[str], speed: float) -> bytes:
+        """Synthesize text and materialize the streamed audio."""
+        return b"".join(self._synth_stream(text, voice, speed))
+
+    def synthesize_sentence(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        speed: float = 1.0
+    ) -> bytes:
+        """
+        Synthesize a single sentence, reusing cached audio for repeated text.
+
+        Args:
+            text: Sentence text
+            voice: Voice to use
+            speed: Speech speed
+
+        Returns:
+            Audio data as bytes
+        """
+        text = " ".join(text.split())
+
+        if len(text) > self.TTS_CACHE_MAX_CHARS:
+            return self._synth(text, voice, speed)
+
+        return self._synth_cached(text, voice, speed)
+
+    def tts_cache_info(self):
+        """Get TTS cache statistics (hits, misses, maxsize, currsize)."""
+        return self._synth_cached.cache_info()
+
     def synthesize_streaming_response(
         self,
         text_chunks: Iterator[str],
@@ -99,6 +288,8 @@ class VoiceService:
         This is optimized for Amanda's streaming responses. Instead of
         converting each tiny chunk to audio (which would be inefficient),
         it buffers text until sentence boundaries and converts sentences.
+        Short sentences are coalesced into one TTS call until the buffer
+        reaches FLUSH_THRESHOLD_CHARS or hits a newline.
 
         Args:
             text_chunks: Iterator of text chunks from Amanda
@@ -111,27 +302,88 @@ class VoiceService:
         """
         if not buffer_sentences:
             # Simple mode: convert each chunk directly
+            synth_stream = functools.partial(self._synth_stream, voice=voice, speed=speed)
             for chunk in text_chunks:
                 if chunk.strip():
-                    yield from self.tts.synthesize_stream(chunk, voice, speed)
+                    yield from synth_stream(chunk)
         else:
             # Smart mode: buffer until sentence boundaries
-            buffer = ""
-            sentence_endings = {'.', '!', '?', '\n'}
+            buffer = self.new_sentence_buffer()
+            feed = buffer.feed
+            synthesize = functools.partial(self.synthesize_sentence, voice=voice, speed=speed)
 
             for chunk in text_chunks:
-                buffer += chunk
-
-                # Check if we hit a sentence boundary
-                if any(buffer.rstrip().endswith(ending) for ending in sentence_endings):
-                    # Convert buffered sentence to audio
-                    if buffer.strip():
-                        yield from self.tts.synthesize_stream(buffer, voice, speed)
-                    buffer = ""
+                segment = feed(chunk)
+                if segment:
+                    yield synthesize(segment)
 
             # Convert any remaining text
-            if buffer.strip():
-                yield from self.tts.synthesize_stream(buffer, voice, speed)
+            segment = buffer.flush()
+            if segment:
+                yield synthesize(segment)
+
+    async def synthesize_streaming_response_async(
+        self,
+        text_chunks: AsyncIterator[str],
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+        max_concurrency: int = 5
+    ) -> AsyncIterator[bytes]:
+        """
+        Async variant of synthesize_streaming_response with parallel TTS.
+
+        Buffered sentences are synthesized concurrently (bounded by
+        max_concurrency) while audio is still yielded in sentence order, so
+        total latency approaches the slowest sentence rather than the sum.
+
+        Args:
+            text_chunks: Async iterator of text chunks from Amanda
+            voice: Voice to use
+            speed: Speech speed
+            max_concurrency: Max TTS requests in flight
+
+        Yields:
+            Audio chunks as bytes, in sentence order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pending = deque()
+
+        async def synthesize(segment: str) -> bytes:
+            async with semaphore:
+                return await asyncio.to_thread(self.synthesize_sentence, segment, voice, speed)
+
+        buffer = self.new_sentence_buffer()
+
+        try:
+            async for chunk in text_chunks:
+                segment = buffer.feed(chunk)
+                if segment:
+                    pending.append(asyncio.create_task(synthesize(segment)))
+
+                # Yield audio that is already done, in order
+                while pending and pending[0].done():
+                    yield pending.popleft().result()
+
+            segment = buffer.flush()
+            if segment:
+                pending.append(asyncio.create_task(synthesize(segment)))
+
+            while pending:
+                yield await pending.popleft()
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def new_sentence_buffer(self) -> '_SentenceBuffer':
+        """
+        Create a sentence buffer using this service's flush thresholds.
+
+        Callers streaming their own text feed() each chunk and synthesize
+        every segment it returns (then flush() at the end), so they batch
+        text the same way as synthesize_streaming_response.
+        """
+        return _SentenceBuffer(self.FIRST_FLUSH_THRESHOLD_CHARS, self.FLUSH_THRESHOLD_CHARS)
 
     @classmethod
     def create_from_config(cls, config) -> 'VoiceService':
@@ -142,6 +394,10 @@ class VoiceService:
         - ASR: whisper (OpenAI API), local-whisper, whisperx
         - TTS: openai, google
 
+        Services are memoized per voice config and API keys, so repeated
+        calls with the same settings return the same instance (until it
+        is closed).
+
         Args:
             config: Configuration object with voice settings
 
@@ -153,6 +409,41 @@ class VoiceService:
         if not voice_config:
             raise ValueError("Voice configuration not found in config")
 
+        key = json.dumps(
+            [voice_config, config.api_keys.get('openai'), config.api_keys.get('google')],
+            sort_keys=True,
+            default=str
+        )
+
+        with cls._instances_lock:
+            service = cls._instances.get(key)
+            if service is None:
+                service = cls._build_from_config(config, voice_config)
+                cls._instances[key] = service
+
+        return service
+
+    @classmethod
+    def _build_from_config(cls, config, voice_config: dict) -> 'VoiceService':
+        """
+        Build providers and a new VoiceService from voice settings.
+
+        Args:
+            config: Configuration object (for API keys)
+            voice_config: The config's voice section
+
+        Returns:
+            New VoiceService instance
+        """
+        # OpenAI-based ASR and TTS share one pooled client
+        openai_client = None
+
+        def get_openai_client():
+            nonlocal openai_client
+            if openai_client is None:
+                openai_client = cls._create_openai_client(config.api_keys.get('openai'))
+            return openai_client
+
         # Create ASR provider
         asr_config = voice_config.get('asr', {})
         asr_provider_type = asr_config.get('provider', 'whisper')
@@ -165,13 +456,12 @@ class VoiceService:
 
             asr_provider = WhisperASRProvider(
                 api_key=api_key,
-                model=asr_config.get('model', 'whisper-1')
+                model=asr_config.get('model', 'whisper-1'),
+                client=get_openai_client()
             )
 
         elif asr_provider_type == 'local-whisper':
             # Local Whisper (runs on your GPU)
-            from .asr_provider import LocalWhisperProvider
-
             asr_provider = LocalWhisperProvider(
                 model_size=asr_config.get('model', 'base'),
                 device=asr_config.get('device')  # None = auto-detect
@@ -179,8 +469,6 @@ class VoiceService:
 
         elif asr_provider_type == 'whisperx':
             # WhisperX (faster local inference)
-            from .asr_provider import WhisperXProvider
-
             asr_provider = WhisperXProvider(
                 model_size=asr_config.get('model', 'base'),
                 device=asr_config.get('device'),
@@ -206,13 +494,12 @@ class VoiceService:
             tts_provider = OpenAITTSProvider(
                 api_key=api_key,
                 model=tts_config.get('model', 'tts-1'),
-                default_voice=tts_config.get('voice', 'nova')
+                default_voice=tts_config.get('voice', 'nova'),
+                client=get_openai_client()
             )
 
         elif tts_provider_type == 'google':
             # Google TTS (Gemini TTS from AI Studio)
-            from .tts_provider import GoogleTTSProvider
-
             api_key = config.api_keys.get('google')
             if not api_key:
                 raise ValueError("Google API key required for Google TTS")
@@ -232,16 +519,99 @@ class VoiceService:
         # Get ASR language
         asr_language = asr_config.get('language', 'en')
 
+        # Optional tempo applied before ASR (1.0 = off)
+        asr_speedup = float(asr_config.get('speedup', 1.0))
+
+        # Race WAV and direct WebM transcription (off = WebM only as a fallback)
+        asr_race_formats = bool(asr_config.get('race_formats', False))
+
+        # TTS output format (opus keeps voice sessions at about half the bandwidth of mp3)
+        audio_format = voice_config.get('audio', {}).get('format', 'opus')
+
         print(f"✓ Voice service created:")
-        print(f"  ASR: {asr_provider_type} ({asr_language})")
-        print(f"  TTS: {tts_provider_type} (voice: {tts_config.get('voice', 'default')})")
+        print(f"  ASR: {asr_provider_type} ({asr_language}, speedup: {asr_speedup}x)")
+        print(f"  TTS: {tts_provider_type} (voice: {tts_config.get('voice', 'default')}, format: {audio_format})")
 
         return cls(
             asr_provider=asr_provider,
             tts_provider=tts_provider,
-            asr_language=asr_language
+            asr_language=asr_language,
+            audio_format=audio_format,
+            asr_speedup=asr_speedup,
+            asr_race_formats=asr_race_formats
         )
 
+    @staticmethod
+    def _create_openai_client(api_key: str):
+        """
+        Create an OpenAI client with a keep-alive connection pool.
+
+        Args:
+            api_key: OpenAI API key
+
+        Returns:
+            OpenAI client
+        """
+        try:
+            import httpx
+            from openai import OpenAI
+        except ImportError:
+            raise ImportError(
+                "OpenAI package not installed. Install with: pip install openai"
+            )
+
+        http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60
+            )
+        )
+        return OpenAI(api_key=api_key, http_client=http_client)
+
+    def warmup(self):
+        """
+        Prime provider connections and models with a tiny TTS and ASR call.
+
+        Moves the one-time TLS/HTTP setup (and model load / CUDA kernel
+        selection for local ASR) from the first user's request to startup.
+        Failures are reported but never raised.
+        """
+        try:
+            self.synthesize_sentence("Hi.")
+        except Exception as e:
+            print(f"TTS warmup failed: {e}")
+
+        # One second of 16 kHz mono silence
+        silence = io.BytesIO()
+        with wave.open(silence, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(b"\x00\x00" * 16000)
+
+        try:
+            self.asr.transcribe(
+                audio_data=silence.getvalue(),
+                language=self.asr_language,
+                audio_format="wav"
+            )
+        except Exception as e:
+            print(f"ASR warmup failed: {e}")
+
+    def close(self):
+        """Close provider HTTP connections (if the providers hold any)."""
+        # A closed service must not be handed out by create_from_config again
+        with self._instances_lock:
+            for key, service in list(self._instances.items()):
+                if service is self:
+                    del self._instances[key]
+
+        for provider in (self.asr, self.tts):
+            close = getattr(provider, 'close', None)
+            if close:
+                close()
+
 
 # Convenience function for quick setup
 def create_voice_service(
@@ -5,12 +5,25 @@ Provides bidirectional audio streaming with minimal latency.
 import asyncio
 import logging
 import json
-from typing import Dict
+from typing import Awaitable, Callable, Dict
 from aiohttp import web, WSMsgType
 
-from src.voice.realtime_voice_service import RealtimeVoiceSession
-from src.voice.voice_service import VoiceService
-from src.config import config
+from src.voice.realtime_voice_service import RealtimeVoiceSession, decode_audio_frame
+
+try:
+    import orjson
+
+    async def _send_json(ws: web.WebSocketResponse, message: dict):
+        """Send a JSON text frame; orjson's bytes go out as-is (no str round trip)."""
+        await ws.send_frame(orjson.dumps(message), WSMsgType.TEXT)
+
+    _loads = orjson.loads
+except ImportError:
+    async def _send_json(ws: web.WebSocketResponse, message: dict):
+        """Send a JSON text frame."""
+        await ws.send_json(message)
+
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -43,8 +56,8 @@ async def voice_stream_handler(request: web.Request) -> web.WebSocketResponse:
     session = None
 
     try:
-        # Create voice service
-        voice_service = VoiceService.create_from_config(config)
+        # Shared voice service (created once at startup)
+        voice_service = request.app['voice_service']
 
         # Create real-time streaming session
         session = RealtimeVoiceSession(
@@ -110,31 +123,29 @@ async def handle_incoming_messages(ws: web.WebSocketResponse, session: RealtimeV
         async for msg in ws:
             if msg.type == WSMsgType.TEXT:
                 try:
-                    data = json.loads(msg.data)
+                    data = _loads(msg.data)
 
                     msg_type = data.get('type')
+                    handler = _HANDLERS.get(msg_type)
 
-                    if msg_type == 'audio_chunk':
-                        # Audio chunk from client
-                        audio_data = data.get('data')
-                        format = data.get('format', 'webm')
-                        is_final = data.get('is_final', False)
-
-                        await session.process_audio_chunk(audio_data, format, is_final)
-
-                    elif msg_type == 'control':
-                        # Control command
-                        command = data.get('command')
-                        params = data.get('params', {})
-
-                        await session.handle_control(command, params)
-
+                    if handler:
+                        await handler(session, data)
                     else:
                         logger.warning(f"Unknown message type: {msg_type}")
 
                 except json.JSONDecodeError as e:
                     logger.error(f"Invalid JSON: {e}")
 
+            elif msg.type == WSMsgType.BINARY:
+                # Binary audio frame (no base64 decoding needed)
+                try:
+                    format, is_final, audio_data = decode_audio_frame(msg.data)
+                except ValueError as e:
+                    logger.error(f"Invalid audio frame: {e}")
+                    continue
+
+                await session.process_audio_chunk(audio_data, format, is_final)
+
             elif msg.type == WSMsgType.ERROR:
                 logger.error(f"WebSocket error: {ws.exception()}")
                 break
@@ -147,6 +158,27 @@ async def handle_incoming_messages(ws: web.WebSocketResponse, session: RealtimeV
         logger.error(f"Error handling incoming messages: {e}")
 
 
+async def _handle_audio_chunk(session: RealtimeVoiceSession, data: dict):
+    """Audio chunk from client."""
+    await session.process_audio_chunk(
+        data.get('data'),
+        data.get('format', 'webm'),
+        data.get('is_final', False)
+    )
+
+
+async def _handle_control(session: RealtimeVoiceSession, data: dict):
+    """Control command from client."""
+    await session.handle_control(data.get('command'), data.get('params', {}))
+
+
+# Incoming JSON message handlers by message type
+_HANDLERS: Dict[str, Callable[[RealtimeVoiceSession, dict], Awaitable[None]]] = {
+    'audio_chunk': _handle_audio_chunk,
+    'control': _handle_control,
+}
+
+
 async def handle_outgoing_messages(ws: web.WebSocketResponse, session: RealtimeVoiceSession):
     """
     Handle outgoing messages to client.
@@ -156,9 +188,14 @@ async def handle_outgoing_messages(ws: web.WebSocketResponse, session: RealtimeV
         session: Real-time voice session
     """
     try:
-        async for message in session.get_output_messages():
-            # Send message to client
-            await ws.send_json(message)
+        async for kind, payload in session.get_output_messages():
+            logger.debug(f"Session {session.session_id} queue_depth={session.queue_depth}")
+
+            # Audio goes out as binary frames, everything else as JSON
+            if kind == 'audio':
+                await ws.send_bytes(payload)
+            else:
+                await _send_json(ws, payload)
 
     except Exception as e:
         logger.error(f"Error handling outgoing messages: {e}")
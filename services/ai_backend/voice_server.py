@@ -8,6 +8,7 @@ import logging
 from aiohttp import web
 
 from src.voice.voice_websocket_handler import setup_voice_websocket_routes
+from src.voice.voice_service import VoiceService
 from src.config import config
 
 # Configure logging
@@ -24,12 +25,30 @@ async def health_check(request: web.Request) -> web.Response:
     return web.json_response({'status': 'healthy', 'service': 'voice-server'})
 
 
+async def warm_up_voice_service(app: web.Application):
+    """Prime TTS/ASR connections before the first session arrives."""
+    logger.info("Warming up voice providers...")
+    await asyncio.to_thread(app['voice_service'].warmup)
+    logger.info("Voice providers warm")
+
+
+async def close_voice_service(app: web.Application):
+    """Release the shared voice service's HTTP connections on shutdown."""
+    app['voice_service'].close()
+
+
 async def create_app() -> web.Application:
     """
     Create and configure the aiohttp application.
     """
     app = web.Application()
 
+    # Build voice service once; shared by all WebSocket sessions
+    app['voice_service'] = VoiceService.create_from_config(config)
+    if config.voice.get('warmup', True):
+        app.on_startup.append(warm_up_voice_service)
+    app.on_cleanup.append(close_voice_service)
+
     # Setup routes
     app.router.add_get('/health', health_check)
 
@@ -2,25 +2,44 @@
 Main Flask application for AI Assistant Backend.
 This is the entry point that initializes all services and starts the server.
 """
+# Import configuration
+from config import get_config
+
+# Greenlet async modes need the standard library patched before anything else
+# imports it; otherwise blocking calls (database, Redis, thread pool waits)
+# stall every connected client
+_ASYNC_MODE = get_config().SOCKETIO_ASYNC_MODE
+if _ASYNC_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+elif _ASYNC_MODE == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
 from flask import Flask, session
 from flask_socketio import SocketIO
 from flask_session import Session
 from flask_cors import CORS
+import logging
 import os
 
-# Import configuration
-from config import get_config
 from branding_config import get_branding_config
 
 # Import database initialization
 from database import db, init_db
 
+# Import orjson-backed JSON provider and Socket.IO serializer
+from utils import ORJSONProvider, SocketIOJSON
+
 # Import route blueprints
 from routes.auth import auth_bp
 from routes.chat import chat_bp
 from routes.user import user_bp
 from routes.branding import branding_bp
 
+# Import gRPC client setup
+from services.grpc_client import enable_cooperative_io
+
 # Import WebSocket handlers
 from websocket.chat_handler import register_handlers
 from websocket.voice_handler import register_voice_handlers
@@ -37,11 +56,24 @@ def create_app():
     # Create Flask application
     app = Flask(__name__)
     
+    # Use orjson for all JSON encoding/decoding (jsonify, dict returns, get_json)
+    app.json_provider_class = ORJSONProvider
+    app.json = ORJSONProvider(app)
+    
     # Load configuration
     config = get_config()
     app.config.from_object(config)
     
+    # Configure logging (level gating keeps suppressed records free)
+    logging.basicConfig(
+        level=config.LOG_LEVEL,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # Initialize session handling
+    if config.SESSION_TYPE == 'redis':
+        import redis
+        app.config['SESSION_REDIS'] = redis.Redis.from_url(config.REDIS_URL)
     Session(app)
     
     # Initialize CORS for cross-origin requests
@@ -65,12 +97,20 @@ def create_app():
         app,
         cors_allowed_origins=config.CORS_ORIGINS,
         manage_session=False,  # We manage sessions ourselves
-        async_mode='threading'  # Use threading for Python 3.12+ compatibility
+        async_mode=config.SOCKETIO_ASYNC_MODE,  # threading unless eventlet/gevent is configured
+        http_compression=True,
+        compression_threshold=config.SOCKETIO_COMPRESSION_THRESHOLD,  # Default 1024 skips batched token frames
+        json=SocketIOJSON  # orjson for every emitted/received packet
     )
     
+    # Let concurrent chat streams share the event loop instead of blocking it
+    # (greenlet modes rely on the monkey patching at the top of this module)
+    enable_cooperative_io(socketio.async_mode)
+    
     # Register WebSocket event handlers
     register_handlers(socketio)
-    register_voice_handlers(socketio)
+    if config.SOCKETIO_VOICE_ENABLED:
+        register_voice_handlers(socketio)
     
     # Root endpoint for health check
     @app.route('/')
@@ -110,6 +150,7 @@ def main():
     print(f"Port: {config.FLASK_PORT}")
     print(f"Database: {config.DATABASE_URL}")
     print(f"AI Backend: {config.GRPC_AI_BACKEND_HOST}:{config.GRPC_AI_BACKEND_PORT}")
+    print(f"Socket.IO async mode: {socketio.async_mode}")
     print("=" * 60)
     print("Server starting...")
     print("Press CTRL+C to quit")
@@ -1,68 +1,157 @@
 """
 Configuration module for Amanda Backend.
 Loads environment variables and provides configuration settings.
+
+Settings are read from the environment once per process (get_config is
+cached) and exposed as a frozen dataclass instance.
 """
+import functools
 import os
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (once; forked workers inherit the flag)
+_DOTENV_LOADED_FLAG = '_AMANDA_DOTENV_LOADED'
+
+if not os.environ.get(_DOTENV_LOADED_FLAG):
+    load_dotenv()
+    os.environ[_DOTENV_LOADED_FLAG] = '1'
+
+
+def _env_bool(name, default):
+    """Read a 'true'/'false' environment variable."""
+    return os.getenv(name, default).lower() == 'true'
 
 
-class Config:
+def _parse_origins(value):
+    """Parse a comma-separated origin list once into an immutable tuple."""
+    return tuple(origin.strip() for origin in value.split(',') if origin.strip())
+
+
+@dataclass(frozen=True)
+class Settings:
     """
-    Configuration class that holds all application settings.
+    Immutable snapshot of all application settings.
     All sensitive data should be loaded from environment variables.
     """
-    
+
     # Flask Configuration
-    SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
-    FLASK_ENV = os.getenv('FLASK_ENV', 'development')
-    FLASK_HOST = os.getenv('FLASK_HOST', '0.0.0.0')
-    FLASK_PORT = int(os.getenv('FLASK_PORT', 5000))
-    
+    SECRET_KEY: str = field(repr=False)  # Never shown in repr/logs
+    FLASK_ENV: str
+    FLASK_HOST: str
+    FLASK_PORT: int
+    LOG_LEVEL: str
+
     # Database Configuration
-    DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///amanda.db')
-    SQLALCHEMY_DATABASE_URI = DATABASE_URL
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
-    
+    DATABASE_URL: str
+    SQLALCHEMY_DATABASE_URI: str
+    SQLALCHEMY_TRACK_MODIFICATIONS: bool
+
     # AI Backend gRPC Configuration
-    GRPC_AI_BACKEND_HOST = os.getenv('GRPC_AI_BACKEND_HOST', 'localhost')
-    GRPC_AI_BACKEND_PORT = int(os.getenv('GRPC_AI_BACKEND_PORT', 50051))
-    
+    GRPC_AI_BACKEND_HOST: str
+    GRPC_AI_BACKEND_PORT: int
+    # Gzip requests and advertise it for responses; worth it when the AI backend is remote
+    GRPC_COMPRESSION_ENABLED: bool
+
+    # Socket.IO Configuration
+    # Async mode: threading (default), eventlet or gevent (greenlet modes
+    # monkey-patch the standard library at startup, see app.py)
+    SOCKETIO_ASYNC_MODE: str
+    # Push-to-talk voice over Socket.IO; real-time voice runs on the aiohttp voice server
+    SOCKETIO_VOICE_ENABLED: bool
+    # Engine.IO payloads at least this many bytes are deflate/gzip-compressed
+    SOCKETIO_COMPRESSION_THRESHOLD: int
+
     # Session Configuration
-    SESSION_TYPE = os.getenv('SESSION_TYPE', 'filesystem')
-    SESSION_PERMANENT = os.getenv('SESSION_PERMANENT', 'False').lower() == 'true'
-    SESSION_USE_SIGNER = os.getenv('SESSION_USE_SIGNER', 'True').lower() == 'true'
-    SESSION_COOKIE_HTTPONLY = True
-    SESSION_COOKIE_SAMESITE = 'Lax'
-    
+    # Defaults to redis when REDIS_URL is set (no per-request file I/O), else filesystem
+    REDIS_URL: Optional[str]
+    SESSION_TYPE: str
+    SESSION_PERMANENT: bool
+    SESSION_USE_SIGNER: bool
+    SESSION_COOKIE_HTTPONLY: bool
+    SESSION_COOKIE_SAMESITE: str
+
     # CORS Configuration
-    CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:8000').split(',')
-    CORS_SUPPORTS_CREDENTIALS = True
-    
+    CORS_ORIGINS: Tuple[str, ...]
+    CORS_SUPPORTS_CREDENTIALS: bool
+
     @classmethod
-    def validate(cls):
+    def from_env(cls):
+        """
+        Build settings from environment variables.
+
+        Returns:
+            Settings: New settings instance
+        """
+        database_url = os.getenv('DATABASE_URL', 'sqlite:///amanda.db')
+        redis_url = os.getenv('REDIS_URL') or None
+
+        return cls(
+            SECRET_KEY=os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production'),
+            FLASK_ENV=os.getenv('FLASK_ENV', 'development'),
+            FLASK_HOST=os.getenv('FLASK_HOST', '0.0.0.0'),
+            FLASK_PORT=int(os.getenv('FLASK_PORT', 5000)),
+            LOG_LEVEL=os.getenv('LOG_LEVEL', 'WARNING').upper(),
+            DATABASE_URL=database_url,
+            SQLALCHEMY_DATABASE_URI=database_url,
+            SQLALCHEMY_TRACK_MODIFICATIONS=False,
+            GRPC_AI_BACKEND_HOST=os.getenv('GRPC_AI_BACKEND_HOST', 'localhost'),
+            GRPC_AI_BACKEND_PORT=int(os.getenv('GRPC_AI_BACKEND_PORT', 50051)),
+            GRPC_COMPRESSION_ENABLED=_env_bool('GRPC_COMPRESSION_ENABLED', 'False'),
+            SOCKETIO_ASYNC_MODE=os.getenv('SOCKETIO_ASYNC_MODE') or 'threading',
+            SOCKETIO_VOICE_ENABLED=_env_bool('SOCKETIO_VOICE_ENABLED', 'True'),
+            SOCKETIO_COMPRESSION_THRESHOLD=int(os.getenv('SOCKETIO_COMPRESSION_THRESHOLD', 128)),
+            REDIS_URL=redis_url,
+            SESSION_TYPE=os.getenv('SESSION_TYPE', 'redis' if redis_url else 'filesystem'),
+            SESSION_PERMANENT=_env_bool('SESSION_PERMANENT', 'False'),
+            SESSION_USE_SIGNER=_env_bool('SESSION_USE_SIGNER', 'True'),
+            SESSION_COOKIE_HTTPONLY=True,
+            SESSION_COOKIE_SAMESITE='Lax',
+            CORS_ORIGINS=_parse_origins(os.getenv('CORS_ORIGINS', 'http://localhost:8000')),
+            CORS_SUPPORTS_CREDENTIALS=True,
+        )
+
+    def validate(self):
         """
         Validate that all required configuration variables are set.
         Raises ValueError if any required variable is missing.
         """
         required_vars = ['SECRET_KEY']
-        missing = [var for var in required_vars if not getattr(cls, var)]
-        
+        missing = [var for var in required_vars if not getattr(self, var)]
+
         if missing:
             raise ValueError(f"Missing required configuration variables: {', '.join(missing)}")
-        
-        if cls.SECRET_KEY == 'dev-secret-key-change-in-production' and cls.FLASK_ENV == 'production':
+
+        if self.SECRET_KEY == 'dev-secret-key-change-in-production' and self.FLASK_ENV == 'production':
             raise ValueError("SECRET_KEY must be changed in production environment")
+        
+        if self.SESSION_TYPE == 'redis' and not self.REDIS_URL:
+            raise ValueError("REDIS_URL is required when SESSION_TYPE is 'redis'")
 
 
+@functools.lru_cache(maxsize=1)
 def get_config():
     """
     Get the configuration object and validate it.
-    
+    Environment variables are read and validated only on the first call.
+
     Returns:
-        Config: The validated configuration object
+        Settings: The validated configuration object
+    """
+    config = Settings.from_env()
+    config.validate()
+    return config
+
+
+class _ConfigMeta(type):
+    """Delegates class attribute access to the cached settings instance."""
+
+    def __getattr__(cls, name):
+        return getattr(get_config(), name)
+
+
+class Config(metaclass=_ConfigMeta):
+    """
+    Backward-compatible alias: Config.SECRET_KEY etc. read from get_config().
     """
-    Config.validate()
-    return Config
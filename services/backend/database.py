@@ -3,12 +3,51 @@ Database initialization and configuration module.
 Sets up SQLAlchemy with Flask application.
 """
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import DateTime
 
 # Initialize SQLAlchemy instance
 # This will be configured with the Flask app in app.py
 db = SQLAlchemy()
 
 
+class utcnow(FunctionElement):
+    """
+    Current UTC time as a naive DATETIME, rendered per dialect.
+
+    Used as a column default=, so it is inlined into each INSERT (no schema
+    DEFAULT needed, which keeps tables created before it working) and fetched
+    back through eager_defaults. Matches the naive UTC values datetime.utcnow
+    used to store.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return 'CURRENT_TIMESTAMP'
+
+
+@compiles(utcnow, 'postgresql')
+def _utcnow_postgresql(element, compiler, **kw):
+    # now() is in the session time zone; convert to naive UTC
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, 'mysql')
+@compiles(utcnow, 'mariadb')
+def _utcnow_mysql(element, compiler, **kw):
+    return 'UTC_TIMESTAMP()'
+
+
+@compiles(utcnow, 'mssql')
+def _utcnow_mssql(element, compiler, **kw):
+    return 'GETUTCDATE()'
+
+
 def init_db(app):
     """
     Initialize the database with the Flask application.
@@ -17,6 +56,10 @@ def init_db(app):
     Args:
         app: The Flask application instance
     """
+    # Larger compiled-statement cache (default 500) so every select() we run stays cached
+    engine_options = app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+    engine_options.setdefault('query_cache_size', 1200)
+    
     # Initialize the database with app context
     db.init_app(app)
     
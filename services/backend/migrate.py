@@ -0,0 +1,215 @@
+"""
+Schema upgrade for databases created before the current models.
+
+db.create_all() only creates missing tables; it never changes existing ones.
+This script brings an existing database up to date with:
+- the message role constraint (CHECK on SQLite, native enum on PostgreSQL)
+- the case-insensitive email index ix_users_email_lower, replacing the old
+  unique ix_users_email index
+- the ix_messages_chat_id_timestamp index
+
+Every step checks the current schema first, so running it again is safe.
+Back up the database before running it.
+
+Usage (from the backend directory, with the same environment as the server):
+    python migrate.py
+"""
+import sys
+from flask import Flask
+from sqlalchemy import func, inspect, select, text
+
+from config import get_config
+from database import db, init_db
+
+# Index created by the old unique=True, index=True email column
+OLD_EMAIL_INDEX = 'ix_users_email'
+
+
+def get_index_names(conn, table_name):
+    """
+    Get the names of a table's indexes.
+    SQLite reflection skips expression indexes such as LOWER(email), so
+    sqlite_master is read directly there.
+
+    Args:
+        conn: Database connection
+        table_name (str): Table to inspect
+
+    Returns:
+        set: Index names
+    """
+    if conn.dialect.name == 'sqlite':
+        return set(conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table "
+                 "AND sql IS NOT NULL"),
+            {'table': table_name}
+        ).scalars())
+
+    return {index['name'] for index in inspect(conn).get_indexes(table_name)}
+
+
+def check_roles(conn, Message):
+    """
+    Make sure every stored role is allowed by the new constraint.
+
+    Args:
+        conn: Database connection
+        Message: Message model
+
+    Raises:
+        SystemExit: If rows with other roles exist
+    """
+    bad_roles = conn.execute(
+        select(Message.__table__.c.role)
+        .where(Message.__table__.c.role.notin_(Message.VALID_ROLES))
+        .distinct()
+    ).scalars().all()
+
+    if bad_roles:
+        sys.exit(f"Messages with invalid roles {bad_roles}; fix them before upgrading")
+
+
+def upgrade_role_sqlite(conn, Message):
+    """
+    Add the role CHECK constraint on SQLite.
+    SQLite cannot add constraints to a table, so messages is rebuilt.
+
+    Args:
+        conn: Database connection
+        Message: Message model
+    """
+    table = Message.__table__
+    enum_name = table.c.role.type.name
+
+    inspector = inspect(conn)
+    if any(check['name'] == enum_name for check in inspector.get_check_constraints('messages')):
+        return
+
+    check_roles(conn, Message)
+
+    # Indexes keep their names when the table is renamed; drop them so the new
+    # table can create them again
+    for index_name in get_index_names(conn, 'messages'):
+        conn.exec_driver_sql(f'DROP INDEX "{index_name}"')
+
+    conn.exec_driver_sql('ALTER TABLE messages RENAME TO _messages_old')
+    table.create(conn)
+
+    columns = ', '.join(column.name for column in table.columns)
+    conn.exec_driver_sql(
+        f'INSERT INTO messages ({columns}) SELECT {columns} FROM _messages_old'
+    )
+    conn.exec_driver_sql('DROP TABLE _messages_old')
+    print("Added message role constraint (rebuilt messages table)")
+
+
+def upgrade_role_postgresql(conn, Message):
+    """
+    Convert the role column to the message_role enum on PostgreSQL.
+
+    Args:
+        conn: Database connection
+        Message: Message model
+    """
+    role_type = Message.__table__.c.role.type
+
+    columns = {column['name']: column for column in inspect(conn).get_columns('messages')}
+    if getattr(columns['role']['type'], 'name', None) == role_type.name:
+        return
+
+    check_roles(conn, Message)
+
+    role_type.create(conn, checkfirst=True)
+    conn.exec_driver_sql(
+        f'ALTER TABLE messages ALTER COLUMN role TYPE {role_type.name} '
+        f'USING role::{role_type.name}'
+    )
+    print("Converted messages.role to the message_role enum")
+
+
+def upgrade_email_index(conn, User):
+    """
+    Replace the case-sensitive unique email index with ix_users_email_lower.
+
+    Args:
+        conn: Database connection
+        User: User model
+    """
+    index_names = get_index_names(conn, 'users')
+    if 'ix_users_email_lower' in index_names:
+        return
+
+    lower_email = func.lower(User.__table__.c.email)
+    duplicates = conn.execute(
+        select(lower_email)
+        .group_by(lower_email)
+        .having(func.count() > 1)
+    ).scalars().all()
+    if duplicates:
+        sys.exit(f"Emails registered more than once (ignoring case): {duplicates}; "
+                 f"merge or remove these accounts before upgrading")
+
+    if OLD_EMAIL_INDEX in index_names:
+        conn.exec_driver_sql(f'DROP INDEX {OLD_EMAIL_INDEX}')
+
+    for index in User.__table__.indexes:
+        if index.name not in index_names:
+            index.create(conn)
+    print("Replaced ix_users_email with ix_users_email_lower")
+
+
+def upgrade_message_indexes(conn, Message):
+    """
+    Create any message indexes the table does not have yet.
+
+    Args:
+        conn: Database connection
+        Message: Message model
+    """
+    index_names = get_index_names(conn, 'messages')
+
+    for index in Message.__table__.indexes:
+        if index.name not in index_names:
+            index.create(conn)
+            print(f"Created index {index.name}")
+
+
+def upgrade(conn):
+    """
+    Run every upgrade step on an existing database.
+
+    Args:
+        conn: Database connection (inside a transaction)
+    """
+    from models.user import User
+    from models.message import Message
+
+    dialect = conn.dialect.name
+    if dialect == 'sqlite':
+        upgrade_role_sqlite(conn, Message)
+    elif dialect == 'postgresql':
+        upgrade_role_postgresql(conn, Message)
+    else:
+        print(f"Skipping message role constraint: not supported for {dialect}")
+
+    upgrade_email_index(conn, User)
+    upgrade_message_indexes(conn, Message)
+
+
+def main():
+    """Upgrade the configured database."""
+    app = Flask(__name__)
+    app.config.from_object(get_config())
+
+    # Creates any missing tables (a new database needs nothing else)
+    init_db(app)
+
+    with app.app_context():
+        with db.engine.begin() as conn:
+            upgrade(conn)
+
+    print("Database schema is up to date")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,15 @@
 """
 Chat model for managing conversation sessions.
 """
-from datetime import datetime
-from database import db
+from sqlalchemy import exists, select
+from sqlalchemy.sql import func
+from operator import attrgetter
+from database import db, utcnow
+from models.message import Message
+
+# API fields of a chat, read in one attrgetter call by to_dict()
+_CHAT_FIELDS = ('id', 'user_id', 'title', 'created_at')
+_chat_values = attrgetter(*_CHAT_FIELDS)
 
 
 class Chat(db.Model):
@@ -16,26 +23,60 @@ class Chat(db.Model):
         created_at (datetime): Timestamp when chat was created
         user (relationship): Many-to-one relationship with User model
         messages (relationship): One-to-many relationship with Message model
+            (plain list; use selectinload() to batch-load it, or messages_query
+            for filtered access)
     """
     
     __tablename__ = 'chats'
+    # Fetch SQL-generated timestamps in the INSERT (RETURNING) instead of a later SELECT
+    __mapper_args__ = {'eager_defaults': True}
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     title = db.Column(db.String(100), nullable=False, default='New Chat')
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, default=utcnow(), nullable=False)
     
     # Relationships
     user = db.relationship('User', back_populates='chats')
-    messages = db.relationship('Message', back_populates='chat', lazy='dynamic', 
-                              cascade='all, delete-orphan', order_by='Message.timestamp')
+    messages = db.relationship('Message', back_populates='chat',
+                              cascade='all, delete-orphan', order_by='[Message.timestamp, Message.id]')
+    
+    @property
+    def messages_query(self):
+        """
+        Select over this chat's messages, ordered by timestamp.
+        Use for filtered lookups instead of loading the whole relationship.
+        
+        Returns:
+            Select: Message select scoped to this chat
+        """
+        return select(Message).where(Message.chat_id == self.id).order_by(Message.timestamp, Message.id)
+    
+    @staticmethod
+    def lookup_owner(chat_id):
+        """
+        Fetch a chat's owner and whether it has messages, without loading the row.
+        Runs one single-row SELECT of the user_id column plus an EXISTS subquery.
+        
+        Args:
+            chat_id (int): Chat ID
+            
+        Returns:
+            Row: (user_id, has_messages), or None if the chat doesn't exist
+        """
+        has_messages = exists().where(Message.chat_id == Chat.id)
+        return db.session.execute(
+            select(Chat.user_id, has_messages).where(Chat.id == chat_id)
+        ).first()
     
     def update_title_from_first_message(self):
         """
         Update chat title based on the first user message.
         Takes the first 40 characters of the first message as the title.
         """
-        first_message = self.messages.filter_by(role='user').first()
+        first_message = db.session.scalars(
+            self.messages_query.where(Message.role == Message.ROLE_USER).limit(1)
+        ).first()
         if first_message:
             # Take first 40 characters, add ellipsis if longer
             content = first_message.content
@@ -51,28 +92,30 @@ class Chat(db.Model):
         Returns:
             datetime: Timestamp of last message, or created_at if no messages
         """
-        last_message = self.messages.order_by(db.desc('timestamp')).first()
-        if last_message:
-            return last_message.timestamp
+        last_timestamp = db.session.scalar(
+            select(func.max(Message.timestamp)).where(Message.chat_id == self.id)
+        )
+        if last_timestamp:
+            return last_timestamp
         return self.created_at
     
-    def to_dict(self, include_messages=False):
+    def to_dict(self, include_messages=False, last_message_time=None):
         """
         Convert chat object to dictionary for API responses.
         
         Args:
             include_messages (bool): Whether to include full message list
+            last_message_time (datetime): Precomputed last message time
+                (e.g. from an aggregate query); looked up if not given
             
         Returns:
             dict: Chat data for API responses
         """
-        data = {
-            'id': self.id,
-            'user_id': self.user_id,
-            'title': self.title,
-            'created_at': self.created_at.isoformat(),
-            'last_message_time': self.get_last_message_time().isoformat()
-        }
+        if last_message_time is None:
+            last_message_time = self.get_last_message_time()
+        
+        data = dict(zip(_CHAT_FIELDS, _chat_values(self)))
+        data['last_message_time'] = last_message_time
         
         if include_messages:
             data['messages'] = [msg.to_dict() for msg in self.messages]
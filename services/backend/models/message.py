@@ -1,8 +1,12 @@
 """
 Message model for storing chat messages.
 """
-from datetime import datetime
-from database import db
+from operator import attrgetter
+from database import db, utcnow
+
+# API fields of a message, read in one attrgetter call by to_dict()
+_MESSAGE_FIELDS = ('id', 'chat_id', 'role', 'content', 'timestamp')
+_message_values = attrgetter(*_MESSAGE_FIELDS)
 
 
 class Message(db.Model):
@@ -19,39 +23,31 @@ class Message(db.Model):
     """
     
     __tablename__ = 'messages'
+    # Fetch SQL-generated timestamps in the INSERT (RETURNING) instead of a later SELECT
+    __mapper_args__ = {'eager_defaults': True}
     
     # Role constants
     ROLE_USER = 'user'
     ROLE_ASSISTANT = 'assistant'
-    VALID_ROLES = [ROLE_USER, ROLE_ASSISTANT]
+    VALID_ROLES = (ROLE_USER, ROLE_ASSISTANT)
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     chat_id = db.Column(db.Integer, db.ForeignKey('chats.id'), nullable=False, index=True)
-    role = db.Column(db.String(20), nullable=False)
+    # Enforced by the database (native enum on PostgreSQL, CHECK constraint elsewhere)
+    role = db.Column(
+        db.Enum(*VALID_ROLES, name='message_role', create_constraint=True, validate_strings=True),
+        nullable=False
+    )
     content = db.Column(db.Text, nullable=False)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    timestamp = db.Column(db.DateTime, default=utcnow(), nullable=False, index=True)
     
     # Relationships
     chat = db.relationship('Chat', back_populates='messages')
     
-    def __init__(self, chat_id, role, content):
-        """
-        Initialize a new message.
-        
-        Args:
-            chat_id (int): ID of the chat this message belongs to
-            role (str): Message role ('user' or 'assistant')
-            content (str): Message text content
-            
-        Raises:
-            ValueError: If role is not valid
-        """
-        if role not in self.VALID_ROLES:
-            raise ValueError(f"Invalid role: {role}. Must be one of {self.VALID_ROLES}")
-        
-        self.chat_id = chat_id
-        self.role = role
-        self.content = content
+    # Serves per-chat MAX(timestamp) and ordered message reads from the index
+    __table_args__ = (
+        db.Index('ix_messages_chat_id_timestamp', chat_id, timestamp.desc()),
+    )
     
     def to_dict(self):
         """
@@ -60,13 +56,7 @@ class Message(db.Model):
         Returns:
             dict: Message data for API responses
         """
-        return {
-            'id': self.id,
-            'chat_id': self.chat_id,
-            'role': self.role,
-            'content': self.content,
-            'timestamp': self.timestamp.isoformat()
-        }
+        return dict(zip(_MESSAGE_FIELDS, _message_values(self)))
     
     def __repr__(self):
         preview = self.content[:30] + '...' if len(self.content) > 30 else self.content
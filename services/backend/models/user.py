@@ -1,9 +1,10 @@
 """
 User model for authentication and user management.
 """
-from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
-from database import db
+from sqlalchemy.orm import validates
+from sqlalchemy.sql import func
+from database import db, utcnow
+from services.auth_service import hash_password, verify_password, needs_rehash
 
 
 class User(db.Model):
@@ -12,35 +13,75 @@ class User(db.Model):
     
     Attributes:
         id (int): Primary key, auto-incremented
-        email (str): Unique email address for the user
+        email (str): Unique email address for the user (stored lowercased)
         password_hash (str): Hashed password (never store plain text!)
         created_at (datetime): Timestamp when user was created
         chats (relationship): One-to-many relationship with Chat model
     """
     
     __tablename__ = 'users'
+    # Fetch SQL-generated timestamps in the INSERT (RETURNING) instead of a later SELECT
+    __mapper_args__ = {'eager_defaults': True}
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    email = db.Column(db.String(255), unique=True, nullable=False, index=True)
+    email = db.Column(db.String(255), nullable=False)
     password_hash = db.Column(db.String(255), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, default=utcnow(), nullable=False)
+    
+    # Case-insensitive uniqueness; also serves lookups by lower(email)
+    __table_args__ = (
+        db.Index('ix_users_email_lower', func.lower(email), unique=True),
+    )
     
     # Relationships
-    chats = db.relationship('Chat', back_populates='user', lazy='dynamic', cascade='all, delete-orphan')
+    chats = db.relationship('Chat', back_populates='user', cascade='all, delete-orphan')
+    
+    @staticmethod
+    def normalize_email(email):
+        """
+        Normalize an email address for storage and lookup.
+        
+        Args:
+            email (str): Email address as entered
+            
+        Returns:
+            str: Stripped, lowercased email
+        """
+        return email.strip().lower()
+    
+    @staticmethod
+    def email_matches(email):
+        """
+        Filter expression matching a normalized email via the lower(email) index.
+        
+        Args:
+            email (str): Normalized email address
+            
+        Returns:
+            Filter expression for select().where()
+        """
+        return func.lower(User.email) == email
+    
+    @validates('email')
+    def _normalize_email(self, key, email):
+        """Always store emails normalized."""
+        return self.normalize_email(email)
     
     def set_password(self, password):
         """
         Hash and set the user's password.
-        Uses Werkzeug's security functions with bcrypt.
+        Uses Argon2id via the auth service.
         
         Args:
             password (str): Plain text password
         """
-        self.password_hash = generate_password_hash(password, method='pbkdf2:sha256')
+        self.password_hash = hash_password(password)
     
     def check_password(self, password):
         """
         Verify a password against the stored hash.
+        Legacy PBKDF2 hashes are upgraded to Argon2 on success
+        (the caller commits the session).
         
         Args:
             password (str): Plain text password to verify
@@ -48,7 +89,13 @@ class User(db.Model):
         Returns:
             bool: True if password matches, False otherwise
         """
-        return check_password_hash(self.password_hash, password)
+        if not verify_password(password, self.password_hash):
+            return False
+        
+        if needs_rehash(self.password_hash):
+            self.set_password(password)
+        
+        return True
     
     def to_dict(self):
         """
@@ -61,7 +108,7 @@ class User(db.Model):
         return {
             'id': self.id,
             'email': self.email,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
     
     def __repr__(self):
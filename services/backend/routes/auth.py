@@ -1,14 +1,35 @@
 """
 Authentication routes for user signup, login, logout, and session checking.
 """
+import logging
 from flask import Blueprint, request, jsonify, session
 from database import db
 from models.user import User
+from sqlalchemy import select
+from services.auth_service import hash_password, verify_password
 import re
 
 # Create blueprint
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
+logger = logging.getLogger(__name__)
+
+# Email format, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Verified against when the email is unknown, so login time doesn't reveal
+# which accounts exist. Computed on first use so importing the module doesn't
+# pay for an Argon2 hash
+_dummy_hash = None
+
+
+def get_dummy_hash():
+    """Get the placeholder password hash, hashing it on the first call."""
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = hash_password('invalid-password-placeholder')
+    return _dummy_hash
+
 
 def is_valid_email(email):
     """
@@ -20,8 +41,21 @@ def is_valid_email(email):
     Returns:
         bool: True if valid email format
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    # Cheap '@' check rejects most malformed input before the regex runs
+    return '@' in email and _EMAIL_RE.match(email) is not None
+
+
+def start_session(user):
+    """
+    Store the logged-in user's profile in the session.
+    The profile endpoint serves it from here without a database lookup.
+    
+    Args:
+        user (User): Authenticated user
+    """
+    session['user_id'] = user.id
+    session['email'] = user.email
+    session['created_at'] = user.created_at.isoformat()
 
 
 @auth_bp.route('/signup', methods=['POST'])
@@ -52,7 +86,7 @@ def signup():
                 'message': 'Email and password are required'
             }), 400
         
-        email = data['email'].strip().lower()
+        email = User.normalize_email(data['email'])
         password = data['password']
         
         # Validate email format
@@ -70,8 +104,10 @@ def signup():
             }), 400
         
         # Check if user already exists
-        existing_user = User.query.filter_by(email=email).first()
-        if existing_user:
+        existing_user = db.session.execute(
+            select(User.id).where(User.email_matches(email))
+        ).scalar_one_or_none()
+        if existing_user is not None:
             return jsonify({
                 'success': False,
                 'message': 'Email already registered'
@@ -85,8 +121,7 @@ def signup():
         db.session.commit()
         
         # Auto-login after signup
-        session['user_id'] = user.id
-        session['email'] = user.email
+        start_session(user)
         
         return jsonify({
             'success': True,
@@ -94,9 +129,9 @@ def signup():
             'user_id': user.id
         }), 201
         
-    except Exception as e:
+    except Exception:
         db.session.rollback()
-        print(f"Signup error: {e}")
+        logger.exception("Signup error")
         return jsonify({
             'success': False,
             'message': 'An error occurred during signup'
@@ -134,22 +169,33 @@ def login():
                 'message': 'Email and password are required'
             }), 400
         
-        email = data['email'].strip().lower()
+        email = User.normalize_email(data['email'])
         password = data['password']
         
         # Find user
-        user = User.query.filter_by(email=email).first()
+        user = db.session.execute(
+            select(User).where(User.email_matches(email))
+        ).scalar_one_or_none()
         
-        # Verify credentials
-        if not user or not user.check_password(password):
+        # Verify credentials (same hashing work whether or not the user exists)
+        if user is None:
+            verify_password(password, get_dummy_hash())
+            password_ok = False
+        else:
+            password_ok = user.check_password(password)
+        
+        if not password_ok:
             return jsonify({
                 'success': False,
                 'message': 'Invalid email or password'
             }), 401
         
+        # Persist an upgraded password hash (legacy PBKDF2 -> Argon2)
+        if user in db.session.dirty:
+            db.session.commit()
+        
         # Create session
-        session['user_id'] = user.id
-        session['email'] = user.email
+        start_session(user)
         
         return jsonify({
             'success': True,
@@ -160,8 +206,9 @@ def login():
             }
         }), 200
         
-    except Exception as e:
-        print(f"Login error: {e}")
+    except Exception:
+        db.session.rollback()
+        logger.exception("Login error")
         return jsonify({
             'success': False,
             'message': 'An error occurred during login'
@@ -185,8 +232,8 @@ def logout():
             'success': True,
             'message': 'Logged out successfully'
         }), 200
-    except Exception as e:
-        print(f"Logout error: {e}")
+    except Exception:
+        logger.exception("Logout error")
         return jsonify({
             'success': False,
             'message': 'An error occurred during logout'
@@ -220,8 +267,8 @@ def check():
             return jsonify({
                 'authenticated': False
             }), 200
-    except Exception as e:
-        print(f"Auth check error: {e}")
+    except Exception:
+        logger.exception("Auth check error")
         return jsonify({
             'authenticated': False
         }), 200
@@ -1,16 +1,40 @@
 """
 Chat management routes for creating chats and retrieving messages.
 """
-from flask import Blueprint, jsonify, session
+import logging
+from flask import Blueprint, request, jsonify, session
 from functools import wraps
+from config import get_config
 from database import db
 from models.chat import Chat
 from models.message import Message
-from sqlalchemy import desc
+from sqlalchemy import desc, func, select
+from sqlalchemy.orm import raiseload
 
 # Create blueprint
 chat_bp = Blueprint('chat', __name__, url_prefix='/api/chat')
 
+logger = logging.getLogger(__name__)
+
+# Message page sizes for get_messages
+DEFAULT_MESSAGE_PAGE_SIZE = 50
+MAX_MESSAGE_PAGE_SIZE = 200
+
+
+def strict_loading():
+    """
+    Loader options that forbid lazy relationship loads outside production.
+    
+    Accessing an unloaded relationship (e.g. chat.user, message.chat) then
+    raises instead of silently issuing one SELECT per row (N+1).
+    
+    Returns:
+        tuple: Options to pass to Query.options()
+    """
+    if get_config().FLASK_ENV == 'production':
+        return ()
+    return (raiseload('*'),)
+
 
 def require_auth(f):
     """
@@ -50,19 +74,29 @@ def list_chats():
     try:
         user_id = session['user_id']
         
-        # Get all chats for this user
-        chats = Chat.query.filter_by(user_id=user_id).all()
+        # Get all chats for this user, most recent activity first (one query);
+        # chats without messages fall back to created_at
+        last_message_time = func.coalesce(func.max(Message.timestamp), Chat.created_at)
+        rows = db.session.execute(
+            select(Chat, last_message_time)
+            .outerjoin(Message, Message.chat_id == Chat.id)
+            .where(Chat.user_id == user_id)
+            .options(*strict_loading())
+            .group_by(Chat.id)
+            .order_by(desc(last_message_time))
+        ).all()
         
-        # Convert to dict and sort by last message time
-        chat_list = [chat.to_dict() for chat in chats]
-        chat_list.sort(key=lambda x: x['last_message_time'], reverse=True)
+        chat_list = [
+            chat.to_dict(last_message_time=last_time)
+            for chat, last_time in rows
+        ]
         
         return jsonify({
             'chats': chat_list
         }), 200
         
-    except Exception as e:
-        print(f"List chats error: {e}")
+    except Exception:
+        logger.exception("List chats error")
         return jsonify({
             'success': False,
             'message': 'An error occurred fetching chats'
@@ -94,12 +128,12 @@ def create_chat():
         return jsonify({
             'chat_id': chat.id,
             'title': chat.title,
-            'created_at': chat.created_at.isoformat()
+            'created_at': chat.created_at
         }), 201
         
-    except Exception as e:
+    except Exception:
         db.session.rollback()
-        print(f"Create chat error: {e}")
+        logger.exception("Create chat error")
         return jsonify({
             'success': False,
             'message': 'An error occurred creating chat'
@@ -110,12 +144,20 @@ def create_chat():
 @require_auth
 def get_messages(chat_id):
     """
-    Get all messages for a specific chat.
+    Get a page of messages for a specific chat (keyset pagination).
     Verifies that the chat belongs to the current user.
     
+    Returns the newest `limit` messages older than `before`, in
+    chronological order. Pass `next_before` back as `before` to load the
+    previous page.
+    
     Args:
         chat_id (int): ID of the chat
         
+    Query params:
+        before (int): Only return messages with an ID lower than this
+        limit (int): Page size (default 50, max 200)
+        
     Response JSON:
         {
             "messages": [
@@ -126,36 +168,58 @@ def get_messages(chat_id):
                     "timestamp": "2024-01-01T00:00:00"
                 },
                 ...
-            ]
+            ],
+            "has_more": false,
+            "next_before": null
         }
     """
     try:
         user_id = session['user_id']
+        before = request.args.get('before', type=int)
+        limit = request.args.get('limit', DEFAULT_MESSAGE_PAGE_SIZE, type=int)
+        limit = max(1, min(limit, MAX_MESSAGE_PAGE_SIZE))
         
-        # Get chat and verify ownership
-        chat = Chat.query.get(chat_id)
+        # Newest page first (one extra row tells whether older messages exist);
+        # the join enforces ownership in the same query
+        stmt = (
+            select(Message)
+            .join(Chat, Chat.id == Message.chat_id)
+            .where(Chat.id == chat_id, Chat.user_id == user_id)
+            .options(*strict_loading())
+        )
+        if before is not None:
+            stmt = stmt.where(Message.id < before)
         
-        if not chat:
-            return jsonify({
-                'success': False,
-                'message': 'Chat not found'
-            }), 404
+        messages = db.session.scalars(stmt.order_by(desc(Message.id)).limit(limit + 1)).all()
         
-        if chat.user_id != user_id:
-            return jsonify({
-                'success': False,
-                'message': 'Access denied'
-            }), 403
+        # No rows: tell a missing or foreign chat apart from an empty page
+        if not messages:
+            owner_id = db.session.scalar(select(Chat.user_id).where(Chat.id == chat_id))
+            
+            if owner_id is None:
+                return jsonify({
+                    'success': False,
+                    'message': 'Chat not found'
+                }), 404
+            
+            if owner_id != user_id:
+                return jsonify({
+                    'success': False,
+                    'message': 'Access denied'
+                }), 403
         
-        # Get all messages for this chat, ordered by timestamp
-        messages = Message.query.filter_by(chat_id=chat_id).order_by(Message.timestamp).all()
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+        messages.reverse()
         
         return jsonify({
-            'messages': [msg.to_dict() for msg in messages]
+            'messages': [msg.to_dict() for msg in messages],
+            'has_more': has_more,
+            'next_before': messages[0].id if has_more else None
         }), 200
         
-    except Exception as e:
-        print(f"Get messages error: {e}")
+    except Exception:
+        logger.exception("Get messages error")
         return jsonify({
             'success': False,
             'message': 'An error occurred fetching messages'
@@ -1,13 +1,17 @@
 """
 User profile routes.
 """
+import logging
 from flask import Blueprint, jsonify, session
 from functools import wraps
+from database import db
 from models.user import User
 
 # Create blueprint
 user_bp = Blueprint('user', __name__, url_prefix='/api/user')
 
+logger = logging.getLogger(__name__)
+
 
 def require_auth(f):
     """
@@ -39,7 +43,16 @@ def get_profile():
         }
     """
     try:
-        user = User.query.get(session['user_id'])
+        # Profile stored at login (see routes.auth.start_session)
+        if 'created_at' in session:
+            return jsonify({
+                'id': session['user_id'],
+                'email': session['email'],
+                'created_at': session['created_at']
+            }), 200
+        
+        # Sessions created before profile caching: load once and remember
+        user = db.session.get(User, session['user_id'])
         
         if not user:
             return jsonify({
@@ -47,10 +60,12 @@ def get_profile():
                 'message': 'User not found'
             }), 404
         
+        session['created_at'] = user.created_at.isoformat()
+        
         return jsonify(user.to_dict()), 200
         
-    except Exception as e:
-        print(f"Profile error: {e}")
+    except Exception:
+        logger.exception("Profile error")
         return jsonify({
             'success': False,
             'message': 'An error occurred fetching profile'
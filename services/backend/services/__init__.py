@@ -2,7 +2,7 @@
 Services package.
 Contains business logic services and external integrations.
 """
-from services.grpc_client import GRPCClient
+from services.grpc_client import GRPCClient, enable_cooperative_io, get_grpc_client
 from services.auth_service import hash_password, verify_password
 
-__all__ = ['GRPCClient', 'hash_password', 'verify_password']
+__all__ = ['GRPCClient', 'enable_cooperative_io', 'get_grpc_client', 'hash_password', 'verify_password']
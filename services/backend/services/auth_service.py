@@ -1,32 +1,78 @@
 """
 Authentication service for password hashing and verification.
-Uses Werkzeug's security functions with PBKDF2-SHA256.
+Uses Argon2id (argon2-cffi, native C implementation).
+
+Hashes created before the switch (Werkzeug PBKDF2-SHA256, prefixed with
+'pbkdf2:') are still accepted and should be rehashed on the next
+successful login (see needs_rehash).
 """
-from werkzeug.security import generate_password_hash, check_password_hash
+import os
+import threading
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from werkzeug.security import check_password_hash
+
+# Module-level hasher (parameters are encoded into every hash it produces)
+PH = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
+# Prefix of legacy Werkzeug PBKDF2 hashes
+LEGACY_HASH_PREFIX = 'pbkdf2:'
+
+# Caps concurrent Argon2 work (64 MiB each). Hashing runs in the calling
+# thread; the C extension releases the GIL, so other threads keep running
+_HASH_SLOTS = threading.BoundedSemaphore(min(4, os.cpu_count() or 1))
 
 
 def hash_password(password):
     """
-    Hash a password using PBKDF2-SHA256.
-    
+    Hash a password using Argon2id.
+
     Args:
         password (str): Plain text password
-        
+
     Returns:
         str: Hashed password
     """
-    return generate_password_hash(password, method='pbkdf2:sha256')
+    with _HASH_SLOTS:
+        return PH.hash(password)
 
 
 def verify_password(password, password_hash):
     """
     Verify a password against a hash.
-    
+    Accepts Argon2 hashes and legacy PBKDF2 hashes.
+
     Args:
         password (str): Plain text password to verify
         password_hash (str): Hash to verify against
-        
+
     Returns:
         bool: True if password matches hash, False otherwise
     """
-    return check_password_hash(password_hash, password)
+    if password_hash.startswith(LEGACY_HASH_PREFIX):
+        return check_password_hash(password_hash, password)
+
+    try:
+        with _HASH_SLOTS:
+            return PH.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def needs_rehash(password_hash):
+    """
+    Check whether a stored hash should be replaced after a successful login.
+
+    Args:
+        password_hash (str): Stored password hash
+
+    Returns:
+        bool: True for legacy PBKDF2 hashes or outdated Argon2 parameters
+    """
+    if password_hash.startswith(LEGACY_HASH_PREFIX):
+        return True
+
+    try:
+        return PH.check_needs_rehash(password_hash)
+    except InvalidHashError:
+        return True
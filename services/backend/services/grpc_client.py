@@ -2,23 +2,101 @@
 gRPC client for communicating with the AI Backend service.
 Handles streaming chat responses from the Amanda AI service.
 """
-import sys
+import atexit
+import importlib.util
+import logging
 import os
+import sys
+import threading
 from typing import Generator
 import grpc
+from config import get_config
+
+# AI backend message descriptors, loaded straight from their file so the
+# ai_backend directory is not put on sys.path for every later import
+DESCRIPTORS_PATH = os.path.join(os.path.dirname(__file__), '../../ai_backend/descriptors.py')
+
+
+def _load_descriptors():
+    """Load ai_backend/descriptors.py once, under its usual module name."""
+    if 'descriptors' in sys.modules:
+        return sys.modules['descriptors']
+
+    spec = importlib.util.spec_from_file_location('descriptors', DESCRIPTORS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules['descriptors'] = module
+    return module
 
-# Add ai_backend to path to import descriptors
-ai_backend_path = os.path.join(os.path.dirname(__file__), '../../ai_backend')
-sys.path.insert(0, ai_backend_path)
 
 try:
-    from descriptors import ChatMessage, ChatChunk, get_service_descriptor
-except ImportError as e:
+    _descriptors = _load_descriptors()
+except (ImportError, OSError) as e:
     raise ImportError(
         f"Failed to import AI backend descriptors. "
         f"Make sure ai_backend/descriptors.py exists. Error: {e}"
     )
 
+ChatMessage = _descriptors.ChatMessage
+ChatChunk = _descriptors.ChatChunk
+
+logger = logging.getLogger(__name__)
+
+# Keep long-lived channels' connections alive between chat turns
+_CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    # Allow keepalive pings on idle pooled channels (0 = no limit)
+    ('grpc.http2.max_pings_without_data', 0),
+    # Chat chunks are a few tokens each; 4 MiB (the default) is far more than enough
+    ('grpc.max_receive_message_length', 1024 * 1024),
+    # Backpressure: chunks are pulled only as fast as they are emitted to the
+    # browser. Without BDP probing the HTTP/2 flow-control window stays at its
+    # initial 64 KiB, so a slow client caps what the AI backend can push ahead
+    # instead of letting the receive buffer grow
+    ('grpc.http2.bdp_probe', 0),
+]
+
+# Socket.IO async mode the client runs under (set by enable_cooperative_io)
+_async_mode = 'threading'
+
+
+def enable_cooperative_io(async_mode):
+    """
+    Keep blocking gRPC streams from stalling the Socket.IO event loop.
+
+    Under threading every event already runs in its own thread. Under gevent
+    gRPC's own gevent integration makes its I/O yield to other greenlets, and
+    under eventlet each response read is moved to eventlet's native thread pool.
+    This only covers gRPC: the rest of a request (database, Redis, thread pool
+    waits) is cooperative only because app.py monkey-patches the standard
+    library, so greenlet modes refuse to start without that patching.
+    Must be called before the first channel is created.
+
+    Args:
+        async_mode (str): Flask-SocketIO async mode in use
+
+    Raises:
+        RuntimeError: If a greenlet mode is used without monkey patching
+    """
+    global _async_mode
+
+    if async_mode == 'gevent':
+        from gevent import monkey
+        if not monkey.is_module_patched('socket'):
+            raise RuntimeError("gevent async mode requires gevent.monkey.patch_all() at startup")
+
+        from grpc.experimental import gevent as grpc_gevent
+        grpc_gevent.init_gevent()
+
+    elif async_mode == 'eventlet':
+        from eventlet import patcher
+        if not patcher.is_monkey_patched('socket'):
+            raise RuntimeError("eventlet async mode requires eventlet.monkey_patch() at startup")
+
+    _async_mode = async_mode
+
 
 class GRPCClient:
     """
@@ -30,39 +108,69 @@ class GRPCClient:
     - Error handling and reconnection
     """
     
-    def __init__(self, host='localhost', port=50051):
+    def __init__(self, host='localhost', port=50051, compression=False):
         """
         Initialize the gRPC client.
         
         Args:
             host (str): AI backend host address
             port (int): AI backend port number
+            compression (bool): Gzip-compress messages on the channel
         """
         self.host = host
         self.port = port
+        self.compression = grpc.Compression.Gzip if compression else grpc.Compression.NoCompression
         self.address = f'{host}:{port}'
         self._channel = None
         self._stub = None
+        self._stream_chat = None
+        # The client is shared by all handler threads; guards channel setup/teardown
+        self._lock = threading.Lock()
     
     def _ensure_connection(self):
         """
         Ensure we have an active connection to the gRPC server.
         Creates a new connection if one doesn't exist.
+        
+        Returns:
+            The StreamChat callable bound to the current channel
         """
-        if self._channel is None:
-            # Create an insecure channel (for development)
-            # In production, use secure channel with SSL/TLS
-            self._channel = grpc.insecure_channel(self.address)
+        stream_chat = self._stream_chat
+        if stream_chat is not None:
+            return stream_chat
+        
+        with self._lock:
+            if self._stream_chat is None:
+                # Create an insecure channel (for development)
+                # In production, use secure channel with SSL/TLS
+                channel = grpc.insecure_channel(
+                    self.address,
+                    options=_CHANNEL_OPTIONS,
+                    compression=self.compression
+                )
+                
+                # Create a generic stub for making RPC calls
+                self._channel = channel
+                self._stub = channel
+                
+                # Build the StreamChat callable once per channel; published last,
+                # since other threads only check this attribute
+                self._stream_chat = channel.unary_stream(
+                    '/amanda.ai.AIService/StreamChat',
+                    request_serializer=ChatMessage.SerializeToString,
+                    response_deserializer=ChatChunk.FromString,
+                )
             
-            # Create a generic stub for making RPC calls
-            self._stub = self._channel
+            return self._stream_chat
     
     def close(self):
         """Close the gRPC connection."""
-        if self._channel:
-            self._channel.close()
-            self._channel = None
-            self._stub = None
+        with self._lock:
+            if self._channel:
+                self._stream_chat = None
+                self._channel.close()
+                self._channel = None
+                self._stub = None
     
     def stream_chat(self, user_id: str, chat_id: str, message: str) -> Generator[str, None, None]:
         """
@@ -88,23 +196,23 @@ class GRPCClient:
             ...     print(chunk, end='', flush=True)
             Hello! How can I help you today?
         """
-        self._ensure_connection()
+        stream_chat = self._ensure_connection()
         
-        # Create the request message
+        # Create the request message (callers pass string IDs; protobuf rejects other types)
         request = ChatMessage(
-            user_id=str(user_id),
-            chat_id=str(chat_id),
+            user_id=user_id,
+            chat_id=chat_id,
             message=message
         )
         
         try:
-            # Make the streaming RPC call
-            # We need to call the StreamChat method on the AIService
-            response_stream = self._channel.unary_stream(
-                '/amanda.ai.AIService/StreamChat',
-                request_serializer=ChatMessage.SerializeToString,
-                response_deserializer=ChatChunk.FromString,
-            )(request)
+            # Make the streaming RPC call on the AIService
+            response_stream = stream_chat(request)
+            
+            if _async_mode == 'eventlet':
+                # Wait for each chunk on a native thread so other greenlets keep running
+                from eventlet import tpool
+                response_stream = tpool.Proxy(response_stream)
             
             # Yield text chunks until done
             for chunk in response_stream:
@@ -115,7 +223,7 @@ class GRPCClient:
                     
         except grpc.RpcError as e:
             # Log the error and re-raise
-            print(f"gRPC error: {e.code()} - {e.details()}")
+            logger.error("gRPC error: %s - %s", e.code(), e.details())
             raise
     
     def __enter__(self):
@@ -127,3 +235,52 @@ class GRPCClient:
         """Context manager exit."""
         self.close()
         return False
+
+
+# Process-wide clients, one per AI backend address; channels and stubs are
+# meant to be reused across calls
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _close_all_clients():
+    """Close every pooled client (registered with atexit)."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+
+atexit.register(_close_all_clients)
+
+
+def get_grpc_client(host=None, port=None):
+    """
+    Get the shared gRPC client for an AI backend address.
+    Each client (and its HTTP/2 connection) lives for the whole process.
+
+    Args:
+        host (str): AI backend host (defaults to GRPC_AI_BACKEND_HOST)
+        port (int): AI backend port (defaults to GRPC_AI_BACKEND_PORT)
+
+    Returns:
+        GRPCClient: Shared client instance for (host, port)
+    """
+    config = get_config()
+    if host is None or port is None:
+        host = host or config.GRPC_AI_BACKEND_HOST
+        port = port or config.GRPC_AI_BACKEND_PORT
+
+    key = (host, int(port))
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = GRPCClient(
+                    host=host,
+                    port=port,
+                    compression=config.GRPC_COMPRESSION_ENABLED
+                )
+
+    return client
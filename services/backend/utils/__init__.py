@@ -0,0 +1,7 @@
+"""
+Utilities package.
+Shared helpers used by routes and handlers.
+"""
+from utils.json import ORJSONProvider, SocketIOJSON
+
+__all__ = ['ORJSONProvider', 'SocketIOJSON']
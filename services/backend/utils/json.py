@@ -0,0 +1,45 @@
+"""
+Fast JSON for API routes (via jsonify) and Socket.IO packets.
+Serializes with orjson (native encoder; datetimes are encoded directly).
+"""
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class ORJSONProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    Installed on the app so jsonify(), dict returns and request.get_json()
+    all use the native encoder/decoder.
+    """
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response from the encoded bytes (no str round trip)."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=str), mimetype='application/json')
+
+
+class SocketIOJSON:
+    """
+    orjson-backed stand-in for the json module used by python-socketio.
+    Passed as SocketIO(json=...) so every emitted packet uses the native encoder.
+    """
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        """Serialize obj to a JSON string (stdlib options such as separators are ignored)."""
+        return orjson.dumps(obj, default=str).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
@@ -2,13 +2,94 @@
 WebSocket chat handler for real-time streaming chat functionality.
 Handles message sending and AI response streaming via Socket.IO.
 """
+import logging
+import time
+from datetime import datetime, timezone
 from flask_socketio import emit, disconnect
 from flask import session, request
 from database import db
 from models.chat import Chat
 from models.message import Message
-from services.grpc_client import GRPCClient
-from config import get_config
+from services.grpc_client import get_grpc_client
+
+logger = logging.getLogger(__name__)
+
+# Token batching: one 'message_token' frame per 64 buffered characters, or once
+# 25 ms have passed when the next chunk arrives (see coalesce_chunks)
+TOKEN_FLUSH_CHARS = 64
+TOKEN_FLUSH_INTERVAL = 0.025
+
+
+def coalesce_chunks(chunks, max_chars=TOKEN_FLUSH_CHARS, max_delay=TOKEN_FLUSH_INTERVAL):
+    """
+    Batch small streamed text chunks into larger ones.
+
+    Each yielded string becomes a single WebSocket frame, so buffering a few
+    tokens cuts frame/serialization/syscall overhead without visible lag.
+
+    The time limit is only checked when a chunk arrives (reading the blocking
+    gRPC iterator leaves no way to wake up in between). While the AI backend
+    pauses, up to max_chars - 1 buffered characters wait for the next chunk
+    or the end of the stream, so max_delay bounds the gap between flushes
+    only while chunks keep arriving.
+
+    Args:
+        chunks (iterable): Text chunks as received from the AI backend
+        max_chars (int): Flush once this many characters are buffered
+        max_delay (float): Flush on the first chunk arriving this many seconds
+            after the last flush
+
+    Yields:
+        str: Concatenated chunks
+    """
+    buf = []
+    buffered = 0
+    last_flush = time.monotonic()
+
+    for chunk in chunks:
+        buf.append(chunk)
+        buffered += len(chunk)
+
+        now = time.monotonic()
+        if buffered >= max_chars or now - last_flush >= max_delay:
+            yield ''.join(buf)
+            buf.clear()
+            buffered = 0
+            last_flush = now
+
+    # Flush whatever is left when the stream ends
+    if buf:
+        yield ''.join(buf)
+
+
+def utc_now():
+    """
+    Current time as naive UTC, matching the stored timestamp columns.
+    Used to stamp a turn's messages when they happen, since they are only
+    inserted after the reply has finished streaming.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def save_turn(chat_id, user_message, assistant_message=None, is_first_message=False):
+    """
+    Persist one chat turn in a single transaction (one commit per turn).
+
+    Args:
+        chat_id (int): Chat the messages belong to
+        user_message (Message): The user's message
+        assistant_message (Message): The AI reply, or None if it failed
+        is_first_message (bool): Whether to derive the chat title from this turn
+    """
+    db.session.add(user_message)
+    if assistant_message is not None:
+        db.session.add(assistant_message)
+    
+    if is_first_message:
+        # Only the first turn needs the Chat object itself
+        db.session.get(Chat, chat_id).update_title_from_first_message()
+    
+    db.session.commit()
 
 
 def require_auth(f):
@@ -33,6 +114,9 @@ def register_handlers(socketio):
         socketio: Flask-SocketIO instance
     """
     
+    # Resolve the AI backend client once; handlers reuse it for every message
+    grpc_client = get_grpc_client()
+    
     @socketio.on('connect')
     def handle_connect():
         """
@@ -40,17 +124,17 @@ def register_handlers(socketio):
         Verify authentication via session.
         """
         if 'user_id' not in session:
-            print("WebSocket connection rejected: Not authenticated")
+            logger.info("WebSocket connection rejected: not authenticated")
             return False  # Reject connection
         
-        print(f"WebSocket connected: User {session['user_id']}")
+        logger.debug("WebSocket connected: user=%s", session['user_id'])
         return True
     
     @socketio.on('disconnect')
     def handle_disconnect():
         """Handle client disconnection."""
         if 'user_id' in session:
-            print(f"WebSocket disconnected: User {session['user_id']}")
+            logger.debug("WebSocket disconnected: user=%s", session['user_id'])
     
     @socketio.on('send_message')
     @require_auth
@@ -61,10 +145,9 @@ def register_handlers(socketio):
         This function:
         1. Validates the message data
         2. Verifies chat ownership
-        3. Saves user message to database
-        4. Streams AI response via gRPC
-        5. Emits response tokens in real-time
-        6. Saves assistant message to database
+        3. Streams AI response via gRPC
+        4. Emits response tokens in real-time
+        5. Saves user and assistant messages in one transaction
         
         Args:
             data (dict): {
@@ -73,98 +156,95 @@ def register_handlers(socketio):
             }
         
         Emits:
-            'message_token': {text: str} - For each chunk of AI response
+            'message_token': {text: str} - For each batch of AI response tokens
             'message_complete': {message_id: int, full_text: str} - When done
             'error': {message: str} - On any error
         """
+        # Address every emit to this client's room directly
+        sid = request.sid
+        
         try:
             user_id = session['user_id']
             
             # Validate input
             if not data or 'chat_id' not in data or 'message' not in data:
-                emit('error', {'message': 'Invalid message data'})
+                emit('error', {'message': 'Invalid message data'}, to=sid)
                 return
             
             chat_id = data['chat_id']
             message_text = data['message'].strip()
             
             if not message_text:
-                emit('error', {'message': 'Message cannot be empty'})
+                emit('error', {'message': 'Message cannot be empty'}, to=sid)
                 return
             
-            # Verify chat exists and belongs to user
-            chat = Chat.query.get(chat_id)
+            # Verify chat exists and belongs to user (no ORM object is loaded)
+            owner = Chat.lookup_owner(chat_id)
             
-            if not chat:
-                emit('error', {'message': 'Chat not found'})
+            if owner is None:
+                emit('error', {'message': 'Chat not found'}, to=sid)
                 return
             
-            if chat.user_id != user_id:
-                emit('error', {'message': 'Access denied'})
+            owner_id, has_messages = owner
+            if owner_id != user_id:
+                emit('error', {'message': 'Access denied'}, to=sid)
                 return
             
-            # Save user message to database
+            # Title is derived from the first message, so note whether this is it
+            is_first_message = not has_messages
+            
+            # User message is saved together with the reply (see save_turn), but
+            # stamped with the time it was received
             user_message = Message(
                 chat_id=chat_id,
                 role=Message.ROLE_USER,
-                content=message_text
+                content=message_text,
+                timestamp=utc_now()
             )
-            db.session.add(user_message)
-            db.session.commit()
-            
-            # Update chat title if this is the first message
-            message_count = Message.query.filter_by(chat_id=chat_id).count()
-            if message_count == 1:  # Only user message so far
-                chat.update_title_from_first_message()
-                db.session.commit()
             
             # Stream response from AI backend via gRPC
-            config = get_config()
-            grpc_client = GRPCClient(
-                host=config.GRPC_AI_BACKEND_HOST,
-                port=config.GRPC_AI_BACKEND_PORT
-            )
-            
-            full_response = ""
+            response_parts = []
             
             try:
-                # Stream each chunk from the AI
-                for chunk in grpc_client.stream_chat(
+                # Stream the AI response in batched chunks
+                for chunk in coalesce_chunks(grpc_client.stream_chat(
                     user_id=str(user_id),
                     chat_id=str(chat_id),
                     message=message_text
-                ):
-                    # Emit token to client
-                    emit('message_token', {'text': chunk})
-                    full_response += chunk
-                
-                # Save assistant message to database
-                assistant_message = Message(
-                    chat_id=chat_id,
-                    role=Message.ROLE_ASSISTANT,
-                    content=full_response
-                )
-                db.session.add(assistant_message)
-                db.session.commit()
-                
-                # Emit completion event
-                emit('message_complete', {
-                    'message_id': assistant_message.id,
-                    'full_text': full_response
-                })
+                )):
+                    # Emit tokens to client
+                    emit('message_token', {'text': chunk}, to=sid)
+                    response_parts.append(chunk)
                 
             except Exception as grpc_error:
-                print(f"gRPC streaming error: {grpc_error}")
+                logger.error("gRPC streaming error: %s", grpc_error)
                 emit('error', {
                     'message': 'AI service unavailable. Please try again later.'
-                })
-                
-            finally:
-                grpc_client.close()
+                }, to=sid)
+                # Keep the user's message even though the reply failed
+                save_turn(chat_id, user_message, is_first_message=is_first_message)
+                return
+            
+            full_response = ''.join(response_parts)
+            
+            # Save both messages to database
+            assistant_message = Message(
+                chat_id=chat_id,
+                role=Message.ROLE_ASSISTANT,
+                content=full_response,
+                timestamp=utc_now()
+            )
+            save_turn(chat_id, user_message, assistant_message, is_first_message)
+            
+            # Emit completion event
+            emit('message_complete', {
+                'message_id': assistant_message.id,
+                'full_text': full_response
+            }, to=sid)
             
-        except Exception as e:
-            print(f"WebSocket message error: {e}")
+        except Exception:
+            logger.exception("WebSocket message error")
             db.session.rollback()
             emit('error', {
                 'message': 'An error occurred processing your message'
-            })
+            }, to=sid)
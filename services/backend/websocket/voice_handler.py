@@ -4,26 +4,126 @@ Handles voice message transcription (ASR) and text-to-speech (TTS) streaming.
 """
 import sys
 import os
-import base64
-import io
+import binascii
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from flask_socketio import emit, disconnect
-from flask import session
+from flask import session, request
 from database import db
 from models.chat import Chat
 from models.message import Message
-from services.grpc_client import GRPCClient
-from config import get_config
+from services.grpc_client import get_grpc_client
+from websocket.chat_handler import coalesce_chunks, save_turn, utc_now
 
-# Add ai_backend to path to import voice service
-ai_backend_path = os.path.join(os.path.dirname(__file__), '../../ai_backend')
-sys.path.insert(0, ai_backend_path)
+logger = logging.getLogger(__name__)
 
-try:
-    from src.voice.voice_service import VoiceService
-    from src.config import config as ai_config
-except ImportError as e:
-    print(f"Warning: Voice service not available: {e}")
-    VoiceService = None
+# ai_backend holds the voice service (imported when voice handlers are registered)
+AI_BACKEND_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../ai_backend'))
+
+
+def load_voice_service():
+    """
+    Import the AI backend's voice service and build it from its config.
+    The ai_backend path is added (at the end of sys.path) only when voice is enabled.
+
+    Returns:
+        VoiceService: Voice service, or None if unavailable or disabled
+    """
+    if AI_BACKEND_PATH not in sys.path:
+        sys.path.append(AI_BACKEND_PATH)
+
+    try:
+        from src.voice.voice_service import VoiceService
+        from src.config import config as ai_config
+    except ImportError as e:
+        logger.warning("Voice service not available: %s", e)
+        return None
+
+    if not ai_config.voice.get('enabled', False):
+        return None
+
+    try:
+        voice_service = VoiceService.create_from_config(ai_config)
+        logger.info("Voice service initialized successfully")
+        return voice_service
+    except Exception:
+        logger.exception("Failed to initialize voice service")
+        return None
+
+
+# Process-wide pool for TTS calls: synthesis overlaps streaming without blocking
+# the Socket.IO worker, and concurrent voice sessions share a bounded set of threads
+_TTS_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='tts')
+
+
+def emit_ready_audio(socketio, pending, audio_format, sid, wait=False):
+    """
+    Emit synthesized sentences as 'voice_chunk' events, in submission order.
+
+    Args:
+        socketio: Flask-SocketIO instance
+        pending (deque): TTS futures, oldest first
+        audio_format (str): Format the TTS provider produces
+        sid (str): Socket.IO session ID of the requesting client
+        wait (bool): Block until every pending sentence is emitted (only from
+            a background task, never from an event handler)
+
+    Returns:
+        bool: False if synthesis failed (remaining work is cancelled)
+    """
+    while pending and (wait or pending[0].done()):
+        try:
+            audio = pending.popleft().result()
+        except Exception:
+            logger.exception("TTS error")
+            for future in pending:
+                future.cancel()
+            pending.clear()
+            socketio.emit('error', {
+                'message': 'Text-to-speech failed. Response text is available.'
+            }, to=sid)
+            return False
+
+        # Raw bytes go out as a binary WebSocket frame (no base64 inflation)
+        socketio.emit('voice_chunk', {'audio': audio, 'format': audio_format}, to=sid)
+
+    return True
+
+
+def send_remaining_audio(socketio, pending, audio_format, sid):
+    """
+    Emit the rest of a reply's audio, then 'voice_complete' (background task).
+
+    Args:
+        socketio: Flask-SocketIO instance
+        pending (deque): TTS futures, oldest first
+        audio_format (str): Format the TTS provider produces
+        sid (str): Socket.IO session ID of the requesting client
+    """
+    if emit_ready_audio(socketio, pending, audio_format, sid, wait=True):
+        socketio.emit('voice_complete', {'format': audio_format}, to=sid)
+
+
+def send_speech(socketio, future, audio_format, sid):
+    """
+    Emit a 'voice_response' once its TTS future completes (background task).
+
+    Args:
+        socketio: Flask-SocketIO instance
+        future (Future): Pending synthesis on the TTS pool
+        audio_format (str): Format the TTS provider produces
+        sid (str): Socket.IO session ID of the requesting client
+    """
+    try:
+        audio = future.result()
+    except Exception as e:
+        logger.exception("TTS error")
+        socketio.emit('error', {'message': f'Text-to-speech failed: {str(e)}'}, to=sid)
+        return
+
+    # Send raw bytes as a binary frame
+    socketio.emit('voice_response', {'audio': audio, 'format': audio_format}, to=sid)
 
 
 def require_auth(f):
@@ -49,13 +149,10 @@ def register_voice_handlers(socketio):
     """
 
     # Initialize voice service if enabled
-    voice_service = None
-    if VoiceService and ai_config.voice.get('enabled', False):
-        try:
-            voice_service = VoiceService.create_from_config(ai_config)
-            print("Voice service initialized successfully")
-        except Exception as e:
-            print(f"Failed to initialize voice service: {e}")
+    voice_service = load_voice_service()
+
+    # Resolve the AI backend client once; handlers reuse it for every message
+    grpc_client = get_grpc_client()
 
     @socketio.on('send_voice_message')
     @require_auth
@@ -67,27 +164,31 @@ def register_voice_handlers(socketio):
         1. Receives audio data from client
         2. Transcribes audio to text using ASR
         3. Processes message through AI (same as text)
-        4. Converts AI response to speech using TTS
-        5. Streams audio response back to client
+        4. Converts each finished sentence to speech while the AI is still streaming
+        5. Streams audio chunks back to client
 
         Args:
             data (dict): {
                 'chat_id': int,
-                'audio': str (base64 encoded audio),
+                'audio': bytes (binary frame) or str (base64, older clients),
                 'format': str (audio format: 'wav', 'webm', etc.)
             }
 
         Emits:
             'voice_transcribed': {text: str} - Transcribed text
-            'message_token': {text: str} - AI response chunks
-            'voice_chunk': {audio: base64_str} - Audio response chunks
-            'message_complete': {message_id: int, full_text: str} - When done
+            'message_token': {text: str} - Batched AI response chunks
+            'voice_chunk': {audio: bytes, format: str} - Audio per sentence, in order
+            'message_complete': {message_id: int, full_text: str} - When text is done
+            'voice_complete': {format: str} - After the last voice_chunk
             'error': {message: str} - On any error
         """
+        # Address every emit to this client's room directly
+        sid = request.sid
+
         if not voice_service:
             emit('error', {
                 'message': 'Voice features are not enabled. Please configure voice in config.yaml'
-            })
+            }, to=sid)
             return
 
         try:
@@ -95,143 +196,153 @@ def register_voice_handlers(socketio):
 
             # Validate input
             if not data or 'chat_id' not in data or 'audio' not in data:
-                emit('error', {'message': 'Invalid voice data'})
+                emit('error', {'message': 'Invalid voice data'}, to=sid)
                 return
 
             chat_id = data['chat_id']
-            audio_base64 = data['audio']
+            audio = data['audio']
             audio_format = data.get('format', 'webm')
 
-            # Verify chat exists and belongs to user
-            chat = Chat.query.get(chat_id)
-            if not chat:
-                emit('error', {'message': 'Chat not found'})
+            # Verify chat exists and belongs to user (no ORM object is loaded)
+            owner = Chat.lookup_owner(chat_id)
+            if owner is None:
+                emit('error', {'message': 'Chat not found'}, to=sid)
                 return
 
-            if chat.user_id != user_id:
-                emit('error', {'message': 'Access denied'})
+            owner_id, has_messages = owner
+            if owner_id != user_id:
+                emit('error', {'message': 'Access denied'}, to=sid)
                 return
 
-            # Decode base64 audio data
-            try:
-                audio_bytes = base64.b64decode(audio_base64)
-            except Exception as e:
-                emit('error', {'message': f'Invalid audio data: {e}'})
-                return
+            # Binary frames arrive as bytes and are passed on without copying;
+            # older clients still send base64 text
+            if isinstance(audio, (bytes, bytearray, memoryview)):
+                audio_bytes = audio
+            else:
+                try:
+                    # a2b_base64 reads the ASCII str buffer in place (b64decode
+                    # would first copy it with str.encode)
+                    audio_bytes = binascii.a2b_base64(audio)
+                except Exception as e:
+                    emit('error', {'message': f'Invalid audio data: {e}'}, to=sid)
+                    return
 
             # Transcribe audio to text using ASR
             try:
-                emit('voice_processing', {'status': 'transcribing'})
+                emit('voice_processing', {'status': 'transcribing'}, to=sid)
                 message_text = voice_service.transcribe_audio(
                     audio_data=audio_bytes,
                     audio_format=audio_format
                 )
 
                 if not message_text or not message_text.strip():
-                    emit('error', {'message': 'Could not transcribe audio. Please try again.'})
+                    emit('error', {'message': 'Could not transcribe audio. Please try again.'}, to=sid)
                     return
 
                 # Send transcribed text back to client
-                emit('voice_transcribed', {'text': message_text})
+                emit('voice_transcribed', {'text': message_text}, to=sid)
 
             except Exception as e:
-                print(f"ASR error: {e}")
-                emit('error', {'message': f'Transcription failed: {str(e)}'})
+                logger.exception("ASR error")
+                emit('error', {'message': f'Transcription failed: {str(e)}'}, to=sid)
                 return
 
-            # Save user message to database
+            # Title is derived from the first message, so note whether this is it
+            is_first_message = not has_messages
+
+            # User message is saved together with the reply (see save_turn), but
+            # stamped with the time it was received
             user_message = Message(
                 chat_id=chat_id,
                 role=Message.ROLE_USER,
-                content=message_text
+                content=message_text,
+                timestamp=utc_now()
             )
-            db.session.add(user_message)
-            db.session.commit()
-
-            # Update chat title if this is the first message
-            message_count = Message.query.filter_by(chat_id=chat_id).count()
-            if message_count == 1:
-                chat.update_title_from_first_message()
-                db.session.commit()
 
             # Stream AI response via gRPC
-            config = get_config()
-            grpc_client = GRPCClient(
-                host=config.GRPC_AI_BACKEND_HOST,
-                port=config.GRPC_AI_BACKEND_PORT
-            )
+            response_parts = []
 
-            full_response = ""
+            # Format the TTS provider was asked to produce
+            tts_format = voice_service.audio_format
+
+            # Sentences are synthesized while the rest of the response streams in
+            tts_pending = deque()
+            tts_ok = True
+            # Same flush rules and cached synthesis as the AI backend's streaming TTS
+            sentence_buf = voice_service.new_sentence_buffer()
 
             try:
-                emit('voice_processing', {'status': 'thinking'})
+                emit('voice_processing', {'status': 'thinking'}, to=sid)
 
-                # Collect text chunks from AI
-                text_chunks = []
-                for chunk in grpc_client.stream_chat(
+                for chunk in coalesce_chunks(grpc_client.stream_chat(
                     user_id=str(user_id),
                     chat_id=str(chat_id),
                     message=message_text
-                ):
-                    emit('message_token', {'text': chunk})
-                    text_chunks.append(chunk)
-                    full_response += chunk
-
-                # Save assistant message to database
-                assistant_message = Message(
-                    chat_id=chat_id,
-                    role=Message.ROLE_ASSISTANT,
-                    content=full_response
-                )
-                db.session.add(assistant_message)
-                db.session.commit()
-
-                # Emit text completion
-                emit('message_complete', {
-                    'message_id': assistant_message.id,
-                    'full_text': full_response
-                })
-
-                # Convert response to speech using TTS
-                try:
-                    emit('voice_processing', {'status': 'synthesizing'})
-
-                    # Get TTS format from config
-                    tts_format = ai_config.voice.get('audio', {}).get('format', 'mp3')
+                )):
+                    emit('message_token', {'text': chunk}, to=sid)
+                    response_parts.append(chunk)
 
-                    # Generate audio from text
-                    audio_response = voice_service.synthesize_response(full_response)
+                    if not tts_ok:
+                        continue
 
-                    # Encode audio as base64
-                    audio_base64 = base64.b64encode(audio_response).decode('utf-8')
+                    segment = sentence_buf.feed(chunk)
+                    if segment:
+                        tts_pending.append(
+                            _TTS_POOL.submit(voice_service.synthesize_sentence, segment)
+                        )
 
-                    # Send complete audio to client
-                    emit('voice_response', {
-                        'audio': audio_base64,
-                        'format': tts_format
-                    })
-
-                except Exception as tts_error:
-                    print(f"TTS error: {tts_error}")
-                    emit('error', {
-                        'message': 'Text-to-speech failed. Response text is available.'
-                    })
+                    tts_ok = emit_ready_audio(socketio, tts_pending, tts_format, sid)
 
             except Exception as grpc_error:
-                print(f"gRPC streaming error: {grpc_error}")
+                logger.error("gRPC streaming error: %s", grpc_error)
+                for future in tts_pending:
+                    future.cancel()
                 emit('error', {
                     'message': 'AI service unavailable. Please try again later.'
-                })
+                }, to=sid)
+                # Keep the user's message even though the reply failed
+                save_turn(chat_id, user_message, is_first_message=is_first_message)
+                return
 
-            finally:
-                grpc_client.close()
+            # Synthesize the trailing partial sentence
+            segment = sentence_buf.flush()
+            if tts_ok and segment:
+                tts_pending.append(
+                    _TTS_POOL.submit(voice_service.synthesize_sentence, segment)
+                )
+
+            full_response = ''.join(response_parts)
+
+            # Save both messages to database
+            assistant_message = Message(
+                chat_id=chat_id,
+                role=Message.ROLE_ASSISTANT,
+                content=full_response,
+                timestamp=utc_now()
+            )
+            save_turn(chat_id, user_message, assistant_message, is_first_message)
+
+            # Emit text completion
+            emit('message_complete', {
+                'message_id': assistant_message.id,
+                'full_text': full_response
+            }, to=sid)
+
+            # Send the remaining audio, then signal the end of playback data;
+            # the wait runs in a background task so this handler returns now
+            if tts_ok:
+                if tts_pending:
+                    emit('voice_processing', {'status': 'synthesizing'}, to=sid)
+                socketio.start_background_task(
+                    send_remaining_audio, socketio, tts_pending, tts_format, sid
+                )
 
         except Exception as e:
-            print(f"WebSocket voice error: {e}")
+            logger.exception("WebSocket voice error")
             db.session.rollback()
             emit('error', {
                 'message': f'An error occurred processing your voice message: {str(e)}'
-            })
+            }, to=sid)
 
     @socketio.on('text_to_speech')
     @require_auth
@@ -248,41 +359,42 @@ def register_voice_handlers(socketio):
             }
 
         Emits:
-            'voice_response': {audio: base64_str, format: str}
+            'voice_response': {audio: bytes, format: str}
             'error': {message: str}
         """
+        # Address every emit to this client's room directly
+        sid = request.sid
+
         if not voice_service:
             emit('error', {
                 'message': 'Voice features are not enabled'
-            })
+            }, to=sid)
             return
 
         try:
             text = data.get('text', '').strip()
             if not text:
-                emit('error', {'message': 'No text provided'})
+                emit('error', {'message': 'No text provided'}, to=sid)
                 return
 
             voice = data.get('voice')
             speed = data.get('speed', 1.0)
 
-            # Generate audio
-            audio_response = voice_service.synthesize_response(
+            # Generate audio on the shared TTS pool
+            future = _TTS_POOL.submit(
+                voice_service.synthesize_response,
                 text=text,
                 voice=voice,
                 speed=speed
             )
 
-            # Get format from config
-            tts_format = ai_config.voice.get('audio', {}).get('format', 'mp3')
+            # Format the TTS provider was asked to produce
+            tts_format = voice_service.audio_format
 
-            # Encode and send
-            audio_base64 = base64.b64encode(audio_response).decode('utf-8')
-            emit('voice_response', {
-                'audio': audio_base64,
-                'format': tts_format
-            })
+            # Emit from a background task when synthesis finishes, instead of
+            # holding this handler for the whole synthesis
+            socketio.start_background_task(send_speech, socketio, future, tts_format, sid)
 
         except Exception as e:
-            print(f"TTS error: {e}")
-            emit('error', {'message': f'Text-to-speech failed: {str(e)}'})
+            logger.exception("TTS error")
+            emit('error', {'message': f'Text-to-speech failed: {str(e)}'}, to=sid)
@@ -127,12 +127,14 @@ class API {
     }
 
     /**
-     * Get all messages in a chat
+     * Get one page of messages in a chat, oldest first
      * @param {number} chatId - Chat ID
-     * @returns {Promise<{messages: Array}>}
+     * @param {number|null} before - Only messages with a lower ID (null = newest page)
+     * @returns {Promise<{messages: Array, has_more: boolean, next_before: number|null}>}
      */
-    async getChatMessages(chatId) {
-        return this.request(`/api/chat/${chatId}/messages`, {
+    async getChatMessagesPage(chatId, before = null) {
+        const query = before === null ? '' : `?before=${before}`;
+        return this.request(`/api/chat/${chatId}/messages${query}`, {
             method: 'GET'
         });
     }
@@ -12,6 +12,9 @@ class Dashboard {
         this.currentChatId = null;
         this.chats = [];
         this.currentMessages = [];
+        // Cursor for the next page of older messages (null = all loaded)
+        this.olderMessagesBefore = null;
+        this.isLoadingOlderMessages = false;
         this.isStreaming = false;
         this.currentStreamingMessage = null;
         this.branding = null;
@@ -196,11 +199,13 @@ class Dashboard {
                 }
             });
             
-            // Load messages
-            const result = await api.getChatMessages(chatId);
+            // Load the newest page of messages; older ones load on scroll-up
+            this.olderMessagesBefore = null;
+            const result = await api.getChatMessagesPage(chatId);
             
             if (result.success && result.data.messages) {
                 this.currentMessages = result.data.messages;
+                this.olderMessagesBefore = result.data.has_more ? result.data.next_before : null;
                 this.renderMessages();
                 
                 // Update chat title
@@ -240,10 +245,51 @@ class Dashboard {
         this.scrollToBottom();
     }
 
+    /**
+     * Load the previous page of messages and prepend it, keeping the scroll position
+     */
+    async loadOlderMessages() {
+        if (this.olderMessagesBefore === null || this.isLoadingOlderMessages) {
+            return;
+        }
+
+        const chatId = this.currentChatId;
+        this.isLoadingOlderMessages = true;
+
+        try {
+            const result = await api.getChatMessagesPage(chatId, this.olderMessagesBefore);
+
+            // Ignore the page if another chat was selected meanwhile
+            if (chatId !== this.currentChatId || !result.success || !result.data.messages) {
+                return;
+            }
+
+            const olderMessages = result.data.messages;
+            this.olderMessagesBefore = result.data.has_more ? result.data.next_before : null;
+            this.currentMessages = olderMessages.concat(this.currentMessages);
+
+            const container = this.elements.messagesContainer;
+            const fragment = document.createDocumentFragment();
+            olderMessages.forEach(message => {
+                this.renderMessage(message, fragment);
+            });
+
+            const previousHeight = container.scrollHeight;
+            container.prepend(fragment);
+            container.scrollTop += container.scrollHeight - previousHeight;
+        } catch (error) {
+            console.error('Error loading older messages:', error);
+        } finally {
+            this.isLoadingOlderMessages = false;
+        }
+    }
+
     /**
      * Render a single message
+     * @param {Object} message - Message to render
+     * @param {Node} parent - Node to append to (defaults to the messages container)
      */
-    renderMessage(message) {
+    renderMessage(message, parent = this.elements.messagesContainer) {
         const messageDiv = document.createElement('div');
         messageDiv.className = 'message ' + message.role;
         messageDiv.dataset.messageId = message.id;
@@ -263,7 +309,7 @@ class Dashboard {
         bubble.appendChild(time);
         messageDiv.appendChild(bubble);
         
-        this.elements.messagesContainer.appendChild(messageDiv);
+        parent.appendChild(messageDiv);
         
         return messageDiv;
     }
@@ -312,6 +358,8 @@ class Dashboard {
             chatSocket.onVoiceTranscribed((data) => this.handleVoiceTranscribed(data));
             chatSocket.onVoiceProcessing((data) => this.handleVoiceProcessing(data));
             chatSocket.onVoiceResponse((data) => this.handleVoiceResponse(data));
+            chatSocket.onVoiceChunk((data) => this.handleVoiceChunk(data));
+            chatSocket.onVoiceComplete((data) => this.handleVoiceComplete(data));
 
             console.log('WebSocket connected');
         } catch (error) {
@@ -454,6 +502,13 @@ class Dashboard {
             e.target.style.height = Math.min(e.target.scrollHeight, 120) + 'px';
         });
 
+        // Load older messages when scrolled near the top
+        this.elements.messagesContainer.addEventListener('scroll', () => {
+            if (this.elements.messagesContainer.scrollTop < 100) {
+                this.loadOlderMessages();
+            }
+        });
+
         // Voice button
         this.elements.voiceBtn.addEventListener('click', () => this.toggleVoiceRecording());
 
@@ -714,11 +769,8 @@ class Dashboard {
             this.elements.voiceStatus.classList.add('processing');
             this.elements.voiceStatusText.textContent = 'Processing audio...';
 
-            // Convert blob to base64
-            const audioBase64 = await this.voiceRecorder.blobToBase64(audioBlob);
-
-            // Send voice message via WebSocket
-            chatSocket.sendVoiceMessage(this.currentChatId, audioBase64, format);
+            // Send voice message via WebSocket as a binary frame (no base64 encoding)
+            chatSocket.sendVoiceMessage(this.currentChatId, audioBlob, format);
 
         } catch (error) {
             console.error('Error processing recording:', error);
@@ -801,6 +853,33 @@ class Dashboard {
             this.resetVoiceUI();
         }
     }
+
+    /**
+     * Handle streamed voice chunk (one sentence of audio)
+     */
+    async handleVoiceChunk(data) {
+        try {
+            // Hide voice status once audio starts arriving
+            this.elements.voiceStatus.style.display = 'none';
+            this.elements.voiceStatus.classList.remove('processing');
+
+            // Chunks arrive in order; play them back to back
+            await this.voicePlayer.queueAudio(data.audio, data.format || 'mp3');
+
+        } catch (error) {
+            console.error('Error playing voice chunk:', error);
+        }
+    }
+
+    /**
+     * Handle end of a streamed voice response
+     */
+    handleVoiceComplete(data) {
+        console.log('Voice response complete');
+        this.elements.voiceStatus.style.display = 'none';
+        this.elements.voiceStatus.classList.remove('processing');
+        this.resetVoiceUI();
+    }
 }
 
 // Initialize dashboard on page load
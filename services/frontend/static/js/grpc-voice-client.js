@@ -4,6 +4,14 @@
  * Uses WebSocket-based approach for bidirectional communication
  */
 
+// Binary audio frames: [codec id (1 byte)][flags (1 byte)][audio bytes]
+// Must match AUDIO_CODECS in src/voice/realtime_voice_service.py
+const AUDIO_CODECS = { mp3: 0x01, opus: 0x02, wav: 0x03, webm: 0x04, ogg: 0x05, aac: 0x06, flac: 0x07 };
+const AUDIO_CODEC_NAMES = Object.fromEntries(
+    Object.entries(AUDIO_CODECS).map(([name, id]) => [id, name])
+);
+const AUDIO_FRAME_FINAL = 0x01;
+
 class GRPCVoiceClient {
     constructor(url = 'ws://localhost:8080') {
         this.url = url;
@@ -36,6 +44,7 @@ class GRPCVoiceClient {
                 // Create WebSocket connection
                 const wsUrl = `${this.url}/voice-stream?user_id=${userId}&chat_id=${chatId}&session_id=${this.sessionId}`;
                 this.websocket = new WebSocket(wsUrl);
+                this.websocket.binaryType = 'arraybuffer';
 
                 // Handle connection open
                 this.websocket.onopen = () => {
@@ -51,7 +60,11 @@ class GRPCVoiceClient {
 
                 // Handle incoming messages
                 this.websocket.onmessage = (event) => {
-                    this.handleMessage(event.data);
+                    if (event.data instanceof ArrayBuffer) {
+                        this.handleAudioFrame(event.data);
+                    } else {
+                        this.handleMessage(event.data);
+                    }
                 };
 
                 // Handle errors
@@ -117,6 +130,23 @@ class GRPCVoiceClient {
         this.websocket.send(JSON.stringify(message));
     }
 
+    /**
+     * Send audio blob to server as a binary frame (no base64 encoding)
+     */
+    sendAudioBlob(audioBlob, format = 'webm', isFinal = false) {
+        if (!this.connected || !this.websocket) {
+            console.error('Not connected to voice service');
+            return;
+        }
+
+        const header = new Uint8Array([
+            AUDIO_CODECS[format] || AUDIO_CODECS.webm,
+            isFinal ? AUDIO_FRAME_FINAL : 0
+        ]);
+
+        this.websocket.send(new Blob([header, audioBlob]));
+    }
+
     /**
      * Send control message
      */
@@ -137,6 +167,27 @@ class GRPCVoiceClient {
         this.websocket.send(JSON.stringify(message));
     }
 
+    /**
+     * Handle incoming binary audio frame from server
+     */
+    handleAudioFrame(buffer) {
+        const header = new Uint8Array(buffer, 0, 2);
+        const format = AUDIO_CODEC_NAMES[header[0]] || 'mp3';
+        const isFinal = (header[1] & AUDIO_FRAME_FINAL) !== 0;
+        const audioBlob = new Blob([buffer.slice(2)], { type: this.getMimeType(format) });
+
+        if (this.onAudioChunk) {
+            this.onAudioChunk({
+                audio: audioBlob,
+                format: format,
+                isFinal: isFinal
+            });
+        }
+
+        // Add to queue for playback
+        this.queueAudio(audioBlob, format);
+    }
+
     /**
      * Handle incoming message from server
      */
@@ -170,6 +221,30 @@ class GRPCVoiceClient {
                     this.queueAudio(message.data, message.format);
                     break;
 
+                case 'turn_final':
+                    // Final audio + status + transcript of a turn in one frame
+                    if (this.onAudioChunk) {
+                        this.onAudioChunk({
+                            audio: message.audio_b64,
+                            format: message.format,
+                            isFinal: true
+                        });
+                    }
+                    this.queueAudio(message.audio_b64, message.format);
+
+                    if (this.onStatusUpdate) {
+                        this.onStatusUpdate(message.status);
+                    }
+
+                    if (this.onTranscriptUpdate) {
+                        this.onTranscriptUpdate({
+                            text: message.text,
+                            role: message.role,
+                            isFinal: true
+                        });
+                    }
+                    break;
+
                 case 'status':
                     // Status update (processing, thinking, etc.)
                     if (this.onStatusUpdate) {
@@ -195,10 +270,10 @@ class GRPCVoiceClient {
     }
 
     /**
-     * Queue audio chunk for playback
+     * Queue audio chunk (Blob or base64 string) for playback
      */
-    queueAudio(base64Audio, format) {
-        this.audioQueue.push({ audio: base64Audio, format: format });
+    queueAudio(audio, format) {
+        this.audioQueue.push({ audio: audio, format: format });
 
         // Start playback if not already playing
         if (!this.isPlaying) {
@@ -219,8 +294,8 @@ class GRPCVoiceClient {
         const { audio, format } = this.audioQueue.shift();
 
         try {
-            // Convert base64 to blob
-            const audioBlob = this.base64ToBlob(audio, format);
+            // Binary frames arrive as Blobs; legacy messages are base64
+            const audioBlob = audio instanceof Blob ? audio : this.base64ToBlob(audio, format);
             const audioUrl = URL.createObjectURL(audioBlob);
 
             // Create and play audio
@@ -257,14 +332,7 @@ class GRPCVoiceClient {
      * Convert base64 to Blob
      */
     base64ToBlob(base64, format) {
-        const mimeTypes = {
-            'mp3': 'audio/mpeg',
-            'wav': 'audio/wav',
-            'webm': 'audio/webm',
-            'opus': 'audio/opus'
-        };
-
-        const mimeType = mimeTypes[format] || 'audio/mpeg';
+        const mimeType = this.getMimeType(format);
         const byteCharacters = atob(base64);
         const byteNumbers = new Array(byteCharacters.length);
 
@@ -276,6 +344,20 @@ class GRPCVoiceClient {
         return new Blob([byteArray], { type: mimeType });
     }
 
+    /**
+     * Get MIME type for an audio format
+     */
+    getMimeType(format) {
+        const mimeTypes = {
+            'mp3': 'audio/mpeg',
+            'wav': 'audio/wav',
+            'webm': 'audio/webm',
+            'opus': 'audio/ogg; codecs=opus'
+        };
+
+        return mimeTypes[format] || 'audio/mpeg';
+    }
+
     /**
      * Generate unique session ID
      */
@@ -350,14 +350,11 @@ class VoiceChatController {
             const mimeType = this.getSupportedMimeType();
             const audioBlob = new Blob(this.audioChunks, { type: mimeType });
 
-            // Convert to base64
-            const base64Audio = await this.blobToBase64(audioBlob);
-
             // Get format
             const format = this.getFormatFromMimeType(mimeType);
 
-            // Send to server
-            this.grpcClient.sendAudioChunk(base64Audio, format, true);
+            // Send to server as a binary frame
+            this.grpcClient.sendAudioBlob(audioBlob, format, true);
 
             console.log(`Sent ${audioBlob.size} bytes of audio`);
 
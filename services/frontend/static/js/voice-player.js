@@ -28,17 +28,17 @@ class VoicePlayer {
     }
 
     /**
-     * Play audio from base64 encoded data
-     * @param {string} base64Audio - Base64 encoded audio data
+     * Play audio from binary or base64 encoded data
+     * @param {ArrayBuffer|Blob|string} audio - Raw audio (binary frame) or base64 string
      * @param {string} format - Audio format (mp3, wav, etc.)
      */
-    async playAudio(base64Audio, format = 'mp3') {
+    async playAudio(audio, format = 'mp3') {
         try {
             // Stop any currently playing audio
             this.stop();
 
-            // Convert base64 to audio blob
-            const audioBlob = this.base64ToBlob(base64Audio, format);
+            // Wrap audio in a blob
+            const audioBlob = this.toBlob(audio, format);
             const audioUrl = URL.createObjectURL(audioBlob);
 
             // Create audio element
@@ -85,8 +85,8 @@ class VoicePlayer {
     /**
      * Add audio to queue for sequential playback
      */
-    async queueAudio(base64Audio, format = 'mp3') {
-        this.queue.push({ base64Audio, format });
+    async queueAudio(audio, format = 'mp3') {
+        this.queue.push({ audio, format });
 
         // If not currently playing, start playback
         if (!this.isPlaying) {
@@ -102,8 +102,8 @@ class VoicePlayer {
             return;
         }
 
-        const { base64Audio, format } = this.queue.shift();
-        await this.playAudio(base64Audio, format);
+        const { audio, format } = this.queue.shift();
+        await this.playAudio(audio, format);
     }
 
     /**
@@ -145,6 +145,20 @@ class VoicePlayer {
         this.queue = [];
     }
 
+    /**
+     * Convert received audio to a Blob
+     * Binary Socket.IO frames arrive as ArrayBuffers; base64 strings are decoded
+     */
+    toBlob(audio, format) {
+        if (audio instanceof Blob) {
+            return audio;
+        }
+        if (typeof audio === 'string') {
+            return this.base64ToBlob(audio, format);
+        }
+        return new Blob([audio], { type: this.getMimeType(format) });
+    }
+
     /**
      * Convert base64 string to Blob
      */
@@ -170,7 +184,7 @@ class VoicePlayer {
             'wav': 'audio/wav',
             'ogg': 'audio/ogg',
             'webm': 'audio/webm',
-            'opus': 'audio/opus',
+            'opus': 'audio/ogg; codecs=opus',
             'flac': 'audio/flac'
         };
 
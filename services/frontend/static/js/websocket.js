@@ -97,17 +97,17 @@ class ChatWebSocket {
     /**
      * Send a voice message
      * @param {number} chatId - Chat ID
-     * @param {string} audioBase64 - Base64 encoded audio
+     * @param {Blob|ArrayBuffer} audio - Recorded audio (sent as a binary frame)
      * @param {string} format - Audio format (webm, wav, etc.)
      */
-    sendVoiceMessage(chatId, audioBase64, format) {
+    sendVoiceMessage(chatId, audio, format) {
         if (!this.socket || !this.connected) {
             throw new Error('WebSocket not connected');
         }
 
         this.socket.emit('send_voice_message', {
             chat_id: chatId,
-            audio: audioBase64,
+            audio: audio,
             format: format
         });
     }
@@ -196,6 +196,28 @@ class ChatWebSocket {
         this.socket.on('voice_response', callback);
     }
 
+    /**
+     * Listen for streamed voice response chunks (one per sentence)
+     * @param {function} callback - Callback function(data)
+     */
+    onVoiceChunk(callback) {
+        if (!this.socket) {
+            throw new Error('WebSocket not initialized');
+        }
+        this.socket.on('voice_chunk', callback);
+    }
+
+    /**
+     * Listen for the end of a streamed voice response
+     * @param {function} callback - Callback function(data)
+     */
+    onVoiceComplete(callback) {
+        if (!this.socket) {
+            throw new Error('WebSocket not initialized');
+        }
+        this.socket.on('voice_complete', callback);
+    }
+
     /**
      * Remove all event listeners
      */
@@ -207,6 +229,8 @@ class ChatWebSocket {
             this.socket.off('voice_transcribed');
             this.socket.off('voice_processing');
             this.socket.off('voice_response');
+            this.socket.off('voice_chunk');
+            this.socket.off('voice_complete');
         }
     }
 